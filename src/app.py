@@ -30,9 +30,12 @@ from src.connectors.whatsapp.outbound import close_whatsapp_outbound
 from src.connectors.whatsapp.outbound import send_messages as send_whatsapp_messages
 from src.core.actions.time_convert import TimeConversionHandler
 from src.core.agent_handler import AgentHandler
+from src.core.geo import prewarm_city_matcher
+from src.core.llm_fallback import close_llm_http_client
 from src.core.orchestrator import MessageOrchestrator
 from src.core.pipeline import Pipeline
 from src.core.state.timezone import TimezoneStateManager
+from src.core.time_classifier import prewarm_classifier
 from src.core.triggers.mention import MentionDetector
 from src.core.triggers.relocation import RelocationDetector
 from src.core.triggers.time import TimeDetector
@@ -162,6 +165,10 @@ async def create_orchestrator(
     Returns:
         Tuple of (orchestrator, pipeline).
     """
+    # Load geonames and the time classifier in the background while the rest of startup runs
+    prewarm_city_matcher()
+    prewarm_classifier()
+
     # Create pipeline components
     time_detector = TimeDetector()
     relocation_detector = RelocationDetector()
@@ -250,8 +257,12 @@ def create_app() -> Quart:
         await close_discord_outbound()
         await close_whatsapp_outbound()
         await close_slack_outbound()
+        await close_llm_http_client()
 
-        # Close MongoDB
+        # Write pending dedupe records, then close MongoDB
+        orchestrator = getattr(app, "orchestrator", None)
+        if orchestrator is not None:
+            await orchestrator.dedupe.flush()
         storage = get_storage()
         await storage.close()
 
@@ -570,6 +581,8 @@ async def run_polling_mode() -> None:
         await close_slack_outbound()
         await close_discord_outbound()
         await close_whatsapp_outbound()
+        await close_llm_http_client()
+        await orchestrator.dedupe.flush()
         await storage.close()
         logger.info("Shutdown complete")
 
@@ -86,8 +86,9 @@ class AgentHandler:
             timeout=agent_config.timeout,
         )
 
-        # Create the ReAct agent with tools
+        # Create the ReAct agents with tools (compiled once, reused per message)
         self.agent = create_react_agent(self.llm, AGENT_TOOLS)
+        self.geo_agent = create_react_agent(self.llm, GEO_INTENT_TOOLS)
 
     async def handle(self, session: Session, event: NormalizedEvent) -> HandlerResult:
         """Handle a message in the context of an active session.
@@ -240,26 +241,27 @@ class AgentHandler:
         messages.append(HumanMessage(content=event.text))
 
         try:
-            # Create agent with geo intent tools
-            geo_agent = create_react_agent(self.llm, GEO_INTENT_TOOLS)
-            result = await geo_agent.ainvoke({"messages": messages})
+            result = await self.geo_agent.ainvoke({"messages": messages})
 
             agent_messages = result.get("messages", [])
             if not agent_messages:
                 return await self._handle_agent_error(session, event, "No response")
 
             # Debug: log all messages from agent
-            logger.debug(f"Geo intent agent returned {len(agent_messages)} messages")
-            for i, msg in enumerate(agent_messages):
-                msg_type = type(msg).__name__
-                content = (
-                    getattr(msg, "content", "")[:200] if hasattr(msg, "content") else str(msg)[:200]
-                )
-                logger.debug(f"  [{i}] {msg_type}: {content}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Geo intent agent returned %d messages", len(agent_messages))
+                for i, msg in enumerate(agent_messages):
+                    msg_type = type(msg).__name__
+                    content = (
+                        getattr(msg, "content", "")[:200]
+                        if hasattr(msg, "content")
+                        else str(msg)[:200]
+                    )
+                    logger.debug("  [%d] %s: %s", i, msg_type, content)
 
             # Check for actions in tool responses
             action_result = extract_tool_action(agent_messages)
-            logger.debug(f"Extracted action_result: {action_result}")
+            logger.debug("Extracted action_result: %s", action_result)
 
             if action_result:
                 action_type, action_data = action_result
@@ -290,10 +292,8 @@ class AgentHandler:
                 if isinstance(msg, AIMessage) and msg.content:
                     raw_content = str(msg.content)
                     response_text = _sanitize_response(raw_content)
-                    logger.debug(f"Found AIMessage content (raw): {raw_content[:200]}")
-                    logger.debug(
-                        f"After sanitization: {response_text[:200] if response_text else '(empty)'}"
-                    )
+                    logger.debug("Found AIMessage content (raw): %.200s", raw_content)
+                    logger.debug("After sanitization: %.200s", response_text or "(empty)")
                     break
 
             if response_text:
@@ -533,7 +533,7 @@ class AgentHandler:
         Returns:
             IANA timezone if we can find the city, None otherwise.
         """
-        from src.core.geo import geocode_city_str
+        from src.core.geo import geocode_city
 
         # Try to find city in user text - simple heuristic
         # Remove common prefixes like "переехал в", "moved to", "я в", "I'm in"
@@ -555,14 +555,10 @@ class AgentHandler:
                 continue
 
             # Try direct geonames lookup (no LLM, just the local database)
-            result = geocode_city_str(candidate, use_llm=False)
-            if result.startswith("FOUND:"):
-                # Extract timezone: "FOUND: City → Timezone"
-                try:
-                    tz_part = result.split("→")[1].strip()
-                    logger.info(f"Fallback geocode found: '{candidate}' → {tz_part}")
-                    return tz_part
-                except (IndexError, ValueError):
-                    continue
+            result = geocode_city(candidate, use_llm=False)
+            if result is not None:
+                _city, tz_iana = result
+                logger.info(f"Fallback geocode found: '{candidate}' → {tz_iana}")
+                return tz_iana
 
         return None
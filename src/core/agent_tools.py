@@ -6,12 +6,22 @@ Delegates to geo.py for geocoding.
 
 from __future__ import annotations
 
+import re
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
 from langchain_core.tools import tool
 
 from src.core.geo import geocode_city_str
 from src.core.time_parse import TIMEZONE_ABBREVIATIONS
 from src.settings import get_settings
 
+# IANA identifier shape: "UTC" or Region/City[/Subcity] (e.g. America/Port-au-Prince)
+_IANA_RE = re.compile(r"UTC|[A-Za-z]+(?:/[A-Za-z_][A-Za-z0-9_+\-]*){1,2}")
+
+# Strips am/pm markers from "3:30pm"-style input in a single pass
+_AMPM_DROP = str.maketrans("", "", "apmAPM")
+
 
 @tool
 def lookup_configured_city(city_name: str) -> str:
@@ -27,15 +37,12 @@ def lookup_configured_city(city_name: str) -> str:
         FOUND: City Name → IANA timezone if found
         NOT_FOUND: message with available cities if not found
     """
-    settings = get_settings()
-    cities = settings.config.timezone.team_cities
-    city_lower = city_name.lower().strip()
-
-    for city in cities:
-        if city.name.lower() == city_lower:
-            return f"FOUND: {city.name} → {city.tz}"
+    tz_config = get_settings().config.timezone
+    city = tz_config.team_city_by_name.get(city_name.lower().strip())
+    if city:
+        return f"FOUND: {city.name} → {city.tz}"
 
-    available = [c.name for c in cities]
+    available = [c.name for c in tz_config.team_cities]
     return f"NOT_FOUND: '{city_name}' not in team cities. Available: {available}"
 
 
@@ -99,8 +106,8 @@ def save_timezone(tz_iana: str) -> str:
     Returns:
         SAVE:timezone confirmation message
     """
-    # Validate it looks like an IANA timezone
-    if "/" not in tz_iana and tz_iana != "UTC":
+    # Validate it looks like an IANA timezone (rejects "Berlin", "foo/bar baz", etc.)
+    if not _IANA_RE.fullmatch(tz_iana):
         return f"ERROR: '{tz_iana}' doesn't look like a valid IANA timezone. Expected format: Region/City"
 
     return f"SAVE:{tz_iana}"
@@ -121,13 +128,10 @@ def convert_time(time_str: str, source_tz: str, target_tz: str) -> str:
     Returns:
         CONVERT: source_time source_tz → target_time target_tz
     """
-    from datetime import datetime
-
-    import pytz
-
     try:
-        source = pytz.timezone(source_tz)
-        target = pytz.timezone(target_tz)
+        # ZoneInfo instances are cached per key - no pytz localize() dance needed
+        source = ZoneInfo(source_tz)
+        target = ZoneInfo(target_tz)
 
         # Parse simple time formats
         now = datetime.now(source)
@@ -136,7 +140,7 @@ def convert_time(time_str: str, source_tz: str, target_tz: str) -> str:
         # Try to parse time
         time_lower = time_str.lower().strip()
         if ":" in time_str:
-            parts = time_str.replace("am", "").replace("pm", "").strip().split(":")
+            parts = time_str.translate(_AMPM_DROP).strip().split(":")
             hour = int(parts[0])
             minute = int(parts[1]) if len(parts) > 1 else 0
             if "pm" in time_lower and hour < 12:
@@ -145,8 +149,6 @@ def convert_time(time_str: str, source_tz: str, target_tz: str) -> str:
             hour = int(time_str)
         else:
             # Try to extract number
-            import re
-
             match = re.search(r"(\d{1,2})", time_str)
             if match:
                 hour = int(match.group(1))
@@ -174,21 +176,21 @@ def no_action() -> str:
     return "NO_ACTION: City mention was not actionable"
 
 
-# List of all tools for the agent
-AGENT_TOOLS = [
+# All tools for the agent (immutable - shared by every agent instance)
+AGENT_TOOLS = (
     lookup_configured_city,
     lookup_tz_abbreviation,
     geocode_city,
     save_timezone,
-]
+)
 
 # Extended tools for geo intent agent (includes time conversion)
-GEO_INTENT_TOOLS = [
+GEO_INTENT_TOOLS = (
     geocode_city,
     save_timezone,
     convert_time,
     no_action,
-]
+)
 
 
 # Backwards compatibility - these are now in geo.py
@@ -5,6 +5,8 @@ Ensures idempotent processing and prevents spam.
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
@@ -14,6 +16,8 @@ from src.settings import get_settings
 if TYPE_CHECKING:
     from src.storage.mongo import MongoStorage
 
+logger = logging.getLogger(__name__)
+
 
 class DedupeManager:
     """Manages event deduplication and response throttling."""
@@ -28,6 +32,10 @@ class DedupeManager:
         self.settings = get_settings()
         # In-memory throttle cache (chat_key -> last_response_time)
         self._throttle_cache: dict[str, datetime] = {}
+        # Processed events waiting for the background batch write
+        self._write_queue: asyncio.Queue[DedupeEvent] = asyncio.Queue()
+        self._pending_writes: set[tuple[Platform, str]] = set()
+        self._writer_task: asyncio.Task[None] | None = None
 
     async def is_duplicate(self, platform: Platform, event_id: str) -> bool:
         """Check if an event has already been processed.
@@ -39,11 +47,16 @@ class DedupeManager:
         Returns:
             True if event was already processed.
         """
+        if (platform, event_id) in self._pending_writes:
+            return True
         return await self.storage.check_dedupe_event(platform, event_id)
 
     async def mark_processed(self, platform: Platform, event_id: str, chat_id: str) -> None:
         """Mark an event as processed.
 
+        The record is written by a background task, batched with other
+        events; until then is_duplicate answers from memory.
+
         Args:
             platform: Event platform.
             event_id: Unique event identifier.
@@ -55,7 +68,32 @@ class DedupeManager:
             chat_id=chat_id,
             created_at=datetime.now(UTC),
         )
-        await self.storage.insert_dedupe_event(event)
+        self._pending_writes.add((platform, event_id))
+        self._write_queue.put_nowait(event)
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._write_pending())
+
+    async def flush(self) -> None:
+        """Wait until every processed event has been written to storage."""
+        await self._write_queue.join()
+
+    async def _write_pending(self) -> None:
+        """Write queued dedupe records in batches until the queue is empty."""
+        config = self.settings.config.dedupe
+        while not self._write_queue.empty():
+            # Let records from concurrent requests join this batch
+            await asyncio.sleep(config.write_linger_seconds)
+            batch: list[DedupeEvent] = []
+            while len(batch) < config.write_batch_size and not self._write_queue.empty():
+                batch.append(self._write_queue.get_nowait())
+            try:
+                await self.storage.insert_dedupe_events(batch)
+            except Exception:
+                logger.exception("Failed to write %d dedupe records", len(batch))
+            finally:
+                for event in batch:
+                    self._pending_writes.discard((event.platform, event.event_id))
+                    self._write_queue.task_done()
 
     def is_throttled(self, platform: Platform, chat_id: str) -> bool:
         """Check if responses to a chat are throttled.
@@ -7,14 +7,28 @@ Consolidates multiple geocoding paths into one clear flow.
 from __future__ import annotations
 
 import logging
+import os
+import pickle
 import re
+import sys
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+import geonamescache
 from geonamescache import GeonamesCache
 
+if TYPE_CHECKING:
+    from langchain_core.runnables import Runnable
+
 logger = logging.getLogger(__name__)
 
 
+# Bump when the pickled geonames index layout changes
+INDEX_CACHE_FORMAT = 2
 # Minimum population for city to be included in fast matcher (reduces false positives)
 MIN_CITY_POPULATION = 50000
 # Minimum name length for ASCII names (avoids short ambiguous names like "Ny", "Li")
@@ -22,8 +36,21 @@ MIN_NAME_LENGTH_ASCII = 3
 # Minimum name length for non-ASCII (CJK characters are complete words at 2 chars)
 MIN_NAME_LENGTH_NON_ASCII = 2
 
-
-@dataclass
+# CJK code point ranges (inclusive) - scripts written without spaces between words
+_CJK_RANGES: tuple[tuple[int, int], ...] = (
+    (0x4E00, 0x9FFF),  # CJK Unified Ideographs
+    (0x3400, 0x4DBF),  # CJK Extension A
+    (0x3040, 0x309F),  # Hiragana
+    (0x30A0, 0x30FF),  # Katakana
+    (0xAC00, 0xD7AF),  # Korean Hangul
+)
+# Word tokens for spaced scripts (hyphens kept for names like "Port-au-Prince")
+_WORD_RE = re.compile(r"[\w-]+")
+# Maximal runs of CJK characters, found in a single C-level pass
+_CJK_RUN_RE = re.compile("[" + "".join(f"{chr(lo)}-{chr(hi)}" for lo, hi in _CJK_RANGES) + "]+")
+
+
+@dataclass(frozen=True, slots=True)
 class DetectedCity:
     """A city name detected in text."""
 
@@ -50,36 +77,31 @@ class CityNameMatcher:
         """Initialize matcher, pre-loading city names."""
         self._name_to_city: dict[str, tuple[str, str, int]] = {}  # name → (city, tz, pop)
         self._initialized = False
+        self._init_lock = threading.Lock()
 
     def _ensure_initialized(self) -> None:
-        """Lazy initialization of city name lookup table."""
+        """Lazy initialization of city name lookup table.
+
+        Derived from the shared geonames hash indexes, so the full city table
+        is only walked once per process.
+        """
         if self._initialized:
             return
 
-        gc = _get_geonames_cache()
-        cities = gc.get_cities()
+        # Serialized so a request arriving mid-prewarm waits instead of rebuilding
+        with self._init_lock:
+            if self._initialized:
+                return
 
-        for city_data in cities.values():
-            population = city_data.get("population", 0)
-            if population < MIN_CITY_POPULATION:
-                continue
+            name_index, altname_index = _get_geonames_indexes()
 
-            city_name = city_data["name"]
-            timezone = city_data["timezone"]
-            entry = (city_name, timezone, population)
+            # Each index already holds the most populous city per key
+            for index in (name_index, altname_index):
+                for name_lower, entry in index.items():
+                    if entry[2] >= MIN_CITY_POPULATION and self._is_valid_name_length(name_lower):
+                        self._add_name(name_lower, entry)
 
-            # Add main name
-            name_lower = city_name.lower()
-            if self._is_valid_name_length(name_lower):
-                self._add_name(name_lower, entry)
-
-            # Add all alternatenames
-            for altname in city_data.get("alternatenames", []):
-                alt_lower = altname.lower()
-                if self._is_valid_name_length(alt_lower):
-                    self._add_name(alt_lower, entry)
-
-        self._initialized = True
+            self._initialized = True
         logger.debug(f"CityNameMatcher initialized with {len(self._name_to_city)} names")
 
     def _is_valid_name_length(self, name: str) -> bool:
@@ -107,23 +129,31 @@ class CityNameMatcher:
         Returns:
             List of detected cities with their timezones.
         """
+        # 1. Word-based search for spaced languages (Latin, Cyrillic, etc.)
+        words = _WORD_RE.findall(text)
+        if not words:
+            # No letters at all (CJK ideographs are \w too) - nothing can match
+            return []
+
         self._ensure_initialized()
 
         found: list[DetectedCity] = []
         seen_timezones: set[str] = set()  # Avoid duplicates
 
-        # 1. Word-based search for spaced languages (Latin, Cyrillic, etc.)
-        words = re.findall(r"[\w-]+", text, re.UNICODE)
+        # Russian case endings are Cyrillic: decide once per message, not per word
+        is_ascii = text.isascii()
+
+        # Case-fold each word once; phrase keys are joined from these
+        lowered = [word.lower() for word in words]
 
         # Try multi-word combinations first (for "New York", "São Paulo", etc.)
         for n_words in (3, 2):  # Try 3-word then 2-word combinations
             for i in range(len(words) - n_words + 1):
-                phrase = " ".join(words[i : i + n_words])
-                city_info = self._name_to_city.get(phrase.lower())
+                city_info = self._name_to_city.get(" ".join(lowered[i : i + n_words]))
                 if city_info and city_info[1] not in seen_timezones:
                     found.append(
                         DetectedCity(
-                            original=phrase,
+                            original=" ".join(words[i : i + n_words]),
                             normalized=city_info[0],
                             timezone=city_info[1],
                         )
@@ -131,8 +161,10 @@ class CityNameMatcher:
                     seen_timezones.add(city_info[1])
 
         # Then single words
-        for word in words:
-            city_info = self._lookup_word(word)
+        for word, word_lower in zip(words, lowered, strict=True):
+            city_info = self._name_to_city.get(word_lower)
+            if city_info is None and not is_ascii:
+                city_info = self._lookup_declined(word)
             if city_info and city_info[1] not in seen_timezones:
                 found.append(
                     DetectedCity(
@@ -149,73 +181,50 @@ class CityNameMatcher:
 
         return found
 
-    def _lookup_word(self, word: str) -> tuple[str, str, int] | None:
-        """Lookup a single word in city names.
-
-        Tries direct lookup, then Russian case normalization.
-        """
-        word_lower = word.lower()
-
-        # Direct lookup
-        city_info = self._name_to_city.get(word_lower)
-        if city_info:
-            return city_info
-
-        # Russian case normalization
+    def _lookup_declined(self, word: str) -> tuple[str, str, int] | None:
+        """Lookup a word via Russian case normalization (after a direct miss)."""
         normalized = _normalize_russian_case(word)
         if normalized != word:
-            city_info = self._name_to_city.get(normalized.lower())
-            if city_info:
-                return city_info
-
+            return self._name_to_city.get(normalized.lower())
         return None
 
     def _find_cjk_cities(self, text: str, seen_timezones: set[str]) -> list[DetectedCity]:
         """Find CJK city names using sliding window.
 
         CJK languages (Chinese, Japanese, Korean) don't use spaces between words,
-        so we need to check all substrings of length 2-4 characters.
+        so we need to check all substrings of length 2-4 characters. Windows are
+        only taken inside CJK runs, so every candidate is all-CJK by construction.
         """
         found: list[DetectedCity] = []
 
+        # Pure-ASCII text (most chat messages) cannot contain CJK - O(1) check
+        if text.isascii():
+            return found
+
         # Only process if text contains CJK characters
-        if not any(self._is_cjk_char(c) for c in text):
+        runs = _CJK_RUN_RE.findall(text)
+        if not runs:
             return found
 
         # Sliding window: check substrings of length 2, 3, 4
         for window_size in (2, 3, 4):
-            for i in range(len(text) - window_size + 1):
-                substr = text[i : i + window_size]
-
-                # Skip if not all CJK
-                if not all(self._is_cjk_char(c) for c in substr):
-                    continue
-
-                city_info = self._name_to_city.get(substr)
-                if city_info and city_info[1] not in seen_timezones:
-                    found.append(
-                        DetectedCity(
-                            original=substr,
-                            normalized=city_info[0],
-                            timezone=city_info[1],
+            for run in runs:
+                for i in range(len(run) - window_size + 1):
+                    substr = run[i : i + window_size]
+
+                    city_info = self._name_to_city.get(substr)
+                    if city_info and city_info[1] not in seen_timezones:
+                        found.append(
+                            DetectedCity(
+                                original=substr,
+                                normalized=city_info[0],
+                                timezone=city_info[1],
+                            )
                         )
-                    )
-                    seen_timezones.add(city_info[1])
+                        seen_timezones.add(city_info[1])
 
         return found
 
-    @staticmethod
-    def _is_cjk_char(char: str) -> bool:
-        """Check if character is CJK (Chinese/Japanese/Korean)."""
-        code = ord(char)
-        return (
-            0x4E00 <= code <= 0x9FFF  # CJK Unified Ideographs
-            or 0x3400 <= code <= 0x4DBF  # CJK Extension A
-            or 0x3040 <= code <= 0x309F  # Hiragana
-            or 0x30A0 <= code <= 0x30FF  # Katakana
-            or 0xAC00 <= code <= 0xD7AF  # Korean Hangul
-        )
-
 
 # Singleton matcher instance (lazy init)
 _matcher: CityNameMatcher | None = None
@@ -229,6 +238,24 @@ def get_city_matcher() -> CityNameMatcher:
     return _matcher
 
 
+def prewarm_city_matcher() -> threading.Thread:
+    """Build the city matcher in a background thread.
+
+    Called at startup so the geonames load overlaps other initialization
+    instead of landing on the first message. Callers that need the matcher
+    before the thread finishes simply wait on its init lock.
+
+    Returns:
+        The started daemon thread.
+    """
+    matcher = get_city_matcher()
+    thread = threading.Thread(
+        target=matcher._ensure_initialized, name="city-matcher-prewarm", daemon=True
+    )
+    thread.start()
+    return thread
+
+
 def find_cities_in_text(text: str) -> list[DetectedCity]:
     """Find all city names in text (convenience function).
 
@@ -253,6 +280,136 @@ def _get_geonames_cache() -> GeonamesCache:
     return _gc
 
 
+# Lowercased name → (city, tz, population) of the most populous match (lazy init)
+_name_index: dict[str, tuple[str, str, int]] | None = None
+# Lowercased alternatename → (city, tz, population) of the most populous match (lazy init)
+_altname_index: dict[str, tuple[str, str, int]] | None = None
+# Guards the one-time index load/build (prewarm thread vs. request path)
+_geonames_indexes_lock = threading.Lock()
+
+
+def _get_geonames_indexes() -> tuple[
+    dict[str, tuple[str, str, int]], dict[str, tuple[str, str, int]]
+]:
+    """Get singleton hash indexes over geonames (name, alternatenames).
+
+    Loaded from the on-disk cache when possible; otherwise built in a single
+    pass over all cities and written back for the next process.
+
+    Returns:
+        Tuple of (name_index, altname_index) keyed by lowercased name.
+    """
+    global _name_index, _altname_index
+    if _name_index is not None and _altname_index is not None:
+        return _name_index, _altname_index
+
+    with _geonames_indexes_lock:
+        if _name_index is None or _altname_index is None:
+            cache_path = _geonames_index_cache_path()
+            indexes = _load_geonames_indexes(cache_path)
+            if indexes is None:
+                indexes = _build_geonames_indexes()
+                _save_geonames_indexes(cache_path, indexes)
+            _name_index, _altname_index = indexes
+        return _name_index, _altname_index
+
+
+def _build_geonames_indexes() -> tuple[
+    dict[str, tuple[str, str, int]], dict[str, tuple[str, str, int]]
+]:
+    """Build (name_index, altname_index) in a single pass over all cities."""
+    name_index: dict[str, tuple[str, str, int]] = {}
+    altname_index: dict[str, tuple[str, str, int]] = {}
+
+    for city_data in _get_geonames_cache().get_cities().values():
+        entry = (
+            city_data["name"],
+            # A few hundred distinct zones across ~26k cities - share one str each
+            sys.intern(city_data["timezone"]),
+            city_data.get("population", 0),
+        )
+        name_lower = entry[0].lower()
+        _keep_most_populous(name_index, name_lower, entry)
+        for altname in city_data.get("alternatenames", []):
+            alt_lower = altname.lower()
+            # Own name is already covered by name_index (which always wins) - skip it
+            if alt_lower != name_lower:
+                _keep_most_populous(altname_index, alt_lower, entry)
+
+    logger.debug(f"Geonames indexes built: {len(name_index)} names, {len(altname_index)} altnames")
+    return name_index, altname_index
+
+
+def _geonames_index_cache_path() -> Path:
+    """Get cache file path for the geonames indexes.
+
+    Keyed on the installed geonamescache version and the cities file's size
+    and mtime, so a data upgrade or a different install invalidates the
+    cache automatically.
+    """
+    try:
+        data_version = version("geonamescache")
+    except PackageNotFoundError:
+        data_version = "unknown"
+    cities_file = (
+        Path(geonamescache.__file__).parent
+        / "data"
+        / f"cities{_get_geonames_cache().min_city_population}.json"
+    )
+    try:
+        stat = cities_file.stat()
+        data_stamp = f"{stat.st_size}_{stat.st_mtime_ns}"
+    except OSError:
+        data_stamp = "nostat"
+    cache_root = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return (
+        Path(cache_root)
+        / "team-ops"
+        / f"geonames_index_v{INDEX_CACHE_FORMAT}_{data_version}_{data_stamp}.pkl"
+    )
+
+
+def _load_geonames_indexes(
+    path: Path,
+) -> tuple[dict[str, tuple[str, str, int]], dict[str, tuple[str, str, int]]] | None:
+    """Load cached geonames indexes, or None if missing or unreadable."""
+    if not path.exists():
+        return None
+    try:
+        with path.open("rb") as f:
+            name_index, altname_index = pickle.load(f)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable geonames index cache {path}: {e}")
+        return None
+    return name_index, altname_index
+
+
+def _save_geonames_indexes(
+    path: Path,
+    indexes: tuple[dict[str, tuple[str, str, int]], dict[str, tuple[str, str, int]]],
+) -> None:
+    """Write geonames indexes to the cache (best-effort, atomic replace)."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("wb") as f:
+            pickle.dump(indexes, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # Atomic so concurrent workers never read a half-written file
+        tmp_path.replace(path)
+    except OSError as e:
+        logger.debug(f"Could not write geonames index cache {path}: {e}")
+        tmp_path.unlink(missing_ok=True)
+
+
+def _keep_most_populous(
+    index: dict[str, tuple[str, str, int]], key: str, entry: tuple[str, str, int]
+) -> None:
+    """Store entry under key unless a more (or equally) populous city is already there."""
+    existing = index.get(key)
+    if existing is None or entry[2] > existing[2]:
+        index[key] = entry
+
+
 def geocode_city(city_name: str, use_llm: bool = True) -> tuple[str, str] | None:
     """Geocode a city name to (city_name, iana_timezone).
 
@@ -286,13 +443,14 @@ def geocode_city(city_name: str, use_llm: bool = True) -> tuple[str, str] | None
     if result:
         return result
 
-    # 2. Russian case normalization
-    normalized = _normalize_russian_case(city_name)
-    if normalized != city_name:
-        result = _lookup_geonames(normalized)
-        if result:
-            logger.debug(f"Found '{city_name}' via Russian normalization → {result[0]}")
-            return result
+    # 2. Russian case normalization (every rule has Cyrillic endings - skip for ASCII)
+    if not city_name.isascii():
+        normalized = _normalize_russian_case(city_name)
+        if normalized != city_name:
+            result = _lookup_geonames(normalized)
+            if result:
+                logger.debug(f"Found '{city_name}' via Russian normalization → {result[0]}")
+                return result
 
     # 3. LLM normalization (for non-English names, regions, islands)
     if use_llm:
@@ -324,38 +482,37 @@ def _lookup_geonames(city_name: str) -> tuple[str, str] | None:
     normalized = city_name.lower().strip()
     if len(normalized) < 2:
         return None
+    return _lookup_geonames_cached(normalized)
 
-    gc = _get_geonames_cache()
-    cities = gc.get_cities()
-
-    # 1. Exact match on name
-    exact_matches: list[tuple[str, str, int]] = []
-    for city_data in cities.values():
-        if city_data["name"].lower() == normalized:
-            population = city_data.get("population", 0)
-            exact_matches.append((city_data["name"], city_data["timezone"], population))
 
-    if exact_matches:
-        best = max(exact_matches, key=lambda x: x[2])
-        return (best[0], best[1])
+@lru_cache(maxsize=4096)
+def _lookup_geonames_cached(normalized: str) -> tuple[str, str] | None:
+    """Probe the geonames indexes for a lowercased, stripped city name."""
+    name_index, altname_index = _get_geonames_indexes()
 
-    # 2. Search in alternatenames
-    altname_matches: list[tuple[str, str, int]] = []
-    for city_data in cities.values():
-        altnames = city_data.get("alternatenames", [])
-        for altname in altnames:
-            if altname.lower() == normalized:
-                population = city_data.get("population", 0)
-                altname_matches.append((city_data["name"], city_data["timezone"], population))
-                break
-
-    if altname_matches:
-        best = max(altname_matches, key=lambda x: x[2])
+    # 1. Exact match on name, 2. then alternatenames (Russian, local names, etc.)
+    best = name_index.get(normalized) or altname_index.get(normalized)
+    if best:
         return (best[0], best[1])
 
     return None
 
 
+# Russian case ending → replacement for its last letter (see _normalize_russian_case)
+_RU_CASE_SUFFIXES: dict[str, str] = {
+    "ску": "",  # Бобруйску → Бобруйск, Минску → Минск
+    "ине": "",  # Берлине → Берлин - prepositional for -ин cities
+    "ву": "а",  # Москву → Москва - accusative case for -ва cities
+    "ве": "а",  # Москве → Москва - prepositional case
+    "ни": "ь",  # Казани → Казань
+    "ну": "",  # Лондону → Лондон, Берлину → Берлин
+    "не": "а",  # Вене → Вена
+    "те": "",  # Ташкенте → Ташкент
+    "ту": "",  # for completeness
+}
+
+
+@lru_cache(maxsize=4096)
 def _normalize_russian_case(city: str) -> str:
     """Normalize Russian city name by removing case endings.
 
@@ -377,47 +534,17 @@ def _normalize_russian_case(city: str) -> str:
     Returns:
         Normalized city name (nominative case attempt).
     """
-    city_lower = city.lower()
+    tail = city[-3:].lower()
 
-    # -ску → -ск (Бобруйску → Бобруйск, Минску → Минск)
-    if city_lower.endswith("ску"):
-        return city[:-1]
-
-    # -ву → -ва (Москву → Москва) - accusative case for -ва cities
-    if city_lower.endswith("ву"):
-        return city[:-1] + ("а" if city[-1].islower() else "А")
-
-    # -ве → -ва (Москве → Москва) - prepositional case
-    if city_lower.endswith("ве"):
-        return city[:-1] + ("а" if city[-1].islower() else "А")
-
-    # -ине → -ин (Берлине → Берлин) - prepositional for -ин cities
-    if city_lower.endswith("ине"):
-        return city[:-1]
-
-    # -ни → -нь (Казани → Казань)
-    if city_lower.endswith("ни"):
-        return city[:-1] + ("ь" if city[-1].islower() else "Ь")
-
-    # -ну → -н (Лондону → Лондон, Берлину → Берлин)
-    if city_lower.endswith("ну"):
-        return city[:-1]
-
-    # -не → -на (Вене → Вена)
-    if city_lower.endswith("не"):
-        return city[:-1] + ("а" if city[-1].islower() else "А")
-
-    # -те → -т (Ташкенте → Ташкент)
-    if city_lower.endswith("те"):
-        return city[:-1]
-
-    # -ту → -т (for completeness)
-    if city_lower.endswith("ту"):
-        return city[:-1]
+    # Longest suffix wins (-ску/-ине before -ну/-не); every rule swaps the last letter
+    for size in (3, 2):
+        replacement = _RU_CASE_SUFFIXES.get(tail[-size:])
+        if replacement is not None:
+            return city[:-1] + (replacement if city[-1].islower() else replacement.upper())
 
     # -е → remove (generic prepositional for consonant-ending cities)  # noqa: RUF003
     # Must be last as it's the most general pattern
-    if city_lower.endswith("е") and len(city_lower) > 3:
+    if tail.endswith("е") and len(city) > 3:
         # Check if removing -е gives a valid consonant ending  # noqa: RUF003
         base = city[:-1]
         if base and base[-1].lower() not in "аеёиоуыэюя":  # Not a vowel
@@ -442,38 +569,59 @@ def _normalize_with_llm(city_name: str) -> str | None:
     Returns:
         Normalized city name, or None if normalization failed.
     """
-    from langchain_openai import ChatOpenAI
-
-    from src.core.prompts import load_prompt
-    from src.settings import get_settings
-
-    settings = get_settings()
-
     # Skip LLM for simple ASCII names (already tried in geonames)
     if city_name.isascii() and len(city_name) > 3 and " " not in city_name:
         return None
 
     try:
-        llm = ChatOpenAI(
+        return _ask_llm_city_name(city_name)
+    except Exception as e:
+        logger.warning(f"LLM city normalization failed: {e}")
+
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _ask_llm_city_name(city_name: str) -> str | None:
+    """Ask the LLM for the city behind a location name.
+
+    Memoized per process, including UNKNOWN answers, so a repeated miss
+    never costs another round trip. Failures raise and are not cached.
+    """
+    from src.core.prompts import load_prompt
+
+    prompt = load_prompt("city_normalize", city_name=city_name)
+    result = _get_city_llm().invoke(prompt)
+    normalized = str(result.content).strip()
+
+    if normalized and normalized != "UNKNOWN":
+        logger.debug(f"LLM normalized '{city_name}' → '{normalized}'")
+        return normalized
+
+    return None
+
+
+# Singleton LLM client for city normalization (lazy init)
+_city_llm: Runnable[Any, Any] | None = None
+
+
+def _get_city_llm() -> Runnable[Any, Any]:
+    """Get singleton LLM client for city normalization."""
+    global _city_llm
+    if _city_llm is None:
+        from langchain_openai import ChatOpenAI
+
+        from src.settings import get_settings
+
+        settings = get_settings()
+        _city_llm = ChatOpenAI(
             base_url=settings.config.llm.base_url,
             api_key=settings.nvidia_api_key,  # type: ignore[arg-type]
             model=settings.config.llm.model,
             temperature=0,
             timeout=15.0,
         ).bind(max_tokens=50)
-
-        prompt = load_prompt("city_normalize", city_name=city_name)
-        result = llm.invoke(prompt)
-        normalized = str(result.content).strip()
-
-        if normalized and normalized != "UNKNOWN":
-            logger.debug(f"LLM normalized '{city_name}' → '{normalized}'")
-            return normalized
-
-    except Exception as e:
-        logger.warning(f"LLM city normalization failed: {e}")
-
-    return None
+    return _city_llm
 
 
 # Convenience function for string result (backwards compatibility)
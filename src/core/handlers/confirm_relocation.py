@@ -7,10 +7,12 @@ No LLM needed - simple yes/no confirmation or city re-entry.
 from __future__ import annotations
 
 import logging
+import re
+from collections import OrderedDict
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
-from src.core.geo import geocode_city_str
+from src.core.geo import geocode_city
 from src.core.models import HandlerResult, OutboundMessage, SessionStatus, TimezoneSource
 from src.core.prompts import get_ui_message
 from src.core.session_utils import MAX_SESSION_ATTEMPTS
@@ -22,8 +24,74 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 # Confirmation words (Russian + English)
-CONFIRM_WORDS = {"да", "yes", "ок", "ok", "верно", "правильно", "+", "угу", "ага", "yep"}
-REJECT_WORDS = {"нет", "no", "неверно", "не", "nope"}
+CONFIRM_WORDS: frozenset[str] = frozenset(
+    {"да", "yes", "ок", "ok", "верно", "правильно", "+", "угу", "ага", "yep"}
+)
+REJECT_WORDS: frozenset[str] = frozenset({"нет", "no", "неверно", "не", "nope"})
+# Replies starting with these also confirm ("да, всё так")
+CONFIRM_PREFIXES: tuple[str, ...] = ("да",)
+
+# Successful geocodes of city replies, keyed by normalized text (LRU, in-process)
+GEOCODE_CACHE_SIZE = 4096
+_geocode_cache: OrderedDict[str, tuple[str, str]] = OrderedDict()
+_REPLY_PUNCT_RE = re.compile(r"[^\w\s-]+")
+
+# Replies longer than this, or with sentence punctuation, are not geocoded
+MAX_CITY_REPLY_LENGTH = 40
+MAX_CITY_REPLY_WORDS = 4
+_SENTENCE_PUNCT_RE = re.compile(r"[?!;:]")
+# Trailing punctuation on a bare city reply ("Berlin!") is not a sentence
+_TRAILING_PUNCT = "?!;:.… "
+
+
+def _normalize_city_reply(text: str) -> str:
+    """Normalize a city reply for caching: lowercase, no punctuation, single spaces."""
+    return " ".join(_REPLY_PUNCT_RE.sub(" ", text).lower().split())
+
+
+def _strip_city_reply(text: str) -> str:
+    """Drop surrounding whitespace and trailing punctuation from a city reply."""
+    return text.strip().rstrip(_TRAILING_PUNCT)
+
+
+def _looks_like_city(text: str) -> bool:
+    """Cheap check that a reply could be a city name rather than a sentence.
+
+    Commas and dots are allowed ("Berlin, Germany", "St. Petersburg"), as is
+    trailing punctuation ("Berlin!").
+    """
+    text = _strip_city_reply(text)
+    return (
+        0 < len(text) <= MAX_CITY_REPLY_LENGTH
+        and len(text.split()) <= MAX_CITY_REPLY_WORDS
+        and _SENTENCE_PUNCT_RE.search(text) is None
+    )
+
+
+def _geocode_reply(text: str) -> tuple[str, str] | None:
+    """Geocode a city reply, reusing earlier successful results.
+
+    Only found cities are cached - misses may come from a transient LLM
+    failure and should be retried next time.
+
+    Args:
+        text: User's reply (raw).
+
+    Returns:
+        Tuple of (city_name, tz_iana), or None if not found.
+    """
+    key = _normalize_city_reply(text)
+    cached = _geocode_cache.get(key)
+    if cached is not None:
+        _geocode_cache.move_to_end(key)
+        return cached
+
+    result = geocode_city(text, use_llm=True)
+    if result is not None:
+        _geocode_cache[key] = result
+        if len(_geocode_cache) > GEOCODE_CACHE_SIZE:
+            _geocode_cache.popitem(last=False)
+    return result
 
 
 class ConfirmRelocationHandler:
@@ -59,7 +127,7 @@ class ConfirmRelocationHandler:
         resolved_tz = session.context.get("resolved_tz")
 
         # 1. Check for confirmation
-        if user_text in CONFIRM_WORDS or user_text.startswith("да"):
+        if user_text in CONFIRM_WORDS or user_text.startswith(CONFIRM_PREFIXES):
             if resolved_tz:
                 return await self._complete_session(session, event, resolved_tz)
             # No resolved_tz - shouldn't happen
@@ -72,53 +140,20 @@ class ConfirmRelocationHandler:
             text = get_ui_message("ask_city")
             return await self._continue_session(session, event, text)
 
-        # 3. User provided city name - try to geocode
-        result = geocode_city_str(event.text, use_llm=True)
-        if result.startswith("FOUND:"):
-            try:
-                parts = result.replace("FOUND:", "").strip().split("→")
-                new_city = parts[0].strip()
-                new_tz = parts[1].strip()
-
-                # Update session with new resolved timezone
-                session.context["resolved_city"] = new_city
-                session.context["resolved_tz"] = new_tz
-                session.context["attempts"] = session.context.get("attempts", 0) + 1
-                session.updated_at = datetime.now(UTC)
-
-                # Check max attempts
-                if session.context["attempts"] >= MAX_SESSION_ATTEMPTS:
-                    return await self._fail_session(session, event)
-
-                await self.storage.update_session(session)
-
-                # Ask for confirmation with new city
-                text = get_ui_message("confirm_relocation", city_name=new_city, tz_iana=new_tz)
-                message = OutboundMessage(
-                    platform=event.platform,
-                    chat_id=event.chat_id,
-                    text=text,
-                    parse_mode="html",
-                )
-                return HandlerResult(should_respond=True, messages=[message])
-
-            except (IndexError, ValueError) as e:
-                logger.warning(f"Failed to parse geocode result: {result} - {e}")
+        # 3. User provided city name - try to geocode (skip LLM for sentences)
+        reply = _strip_city_reply(event.text)
+        result = _geocode_reply(reply) if _looks_like_city(reply) else None
+        if result is not None:
+            new_city, new_tz = result
+            # Update session with new resolved timezone, ask for confirmation
+            session.context["resolved_city"] = new_city
+            session.context["resolved_tz"] = new_tz
+            text = get_ui_message("confirm_relocation", city_name=new_city, tz_iana=new_tz)
+            return await self._continue_session(session, event, text, parse_mode="html")
 
         # 4. City not found - ask again
-        session.context["attempts"] = session.context.get("attempts", 0) + 1
-        if session.context["attempts"] >= MAX_SESSION_ATTEMPTS:
-            return await self._fail_session(session, event)
-
-        await self.storage.update_session(session)
         text = get_ui_message("city_not_found", city_name=event.text)
-        message = OutboundMessage(
-            platform=event.platform,
-            chat_id=event.chat_id,
-            text=text,
-            parse_mode="plain",
-        )
-        return HandlerResult(should_respond=True, messages=[message])
+        return await self._continue_session(session, event, text)
 
     async def _complete_session(
         self, session: Session, event: NormalizedEvent, timezone: str
@@ -151,9 +186,13 @@ class ConfirmRelocationHandler:
         return HandlerResult(should_respond=True, messages=[message])
 
     async def _continue_session(
-        self, session: Session, event: NormalizedEvent, text: str
+        self,
+        session: Session,
+        event: NormalizedEvent,
+        text: str,
+        parse_mode: Literal["plain", "html"] = "plain",
     ) -> HandlerResult:
-        """Continue session with prompt for more info."""
+        """Count an attempt and persist the session once, or fail it at the limit."""
         session.context["attempts"] = session.context.get("attempts", 0) + 1
         session.updated_at = datetime.now(UTC)
 
@@ -165,7 +204,7 @@ class ConfirmRelocationHandler:
             platform=event.platform,
             chat_id=event.chat_id,
             text=text,
-            parse_mode="plain",
+            parse_mode=parse_mode,
         )
         return HandlerResult(should_respond=True, messages=[message])
 
@@ -6,25 +6,35 @@ When regex extraction fails, use LLM to extract times.
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
-import threading
+import re
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
-from pathlib import Path
-from typing import TYPE_CHECKING
+from functools import cache
+from typing import TYPE_CHECKING, TypeVar
 
 import httpx
-from jinja2 import Template
+import orjson
 
 from src.core.models import ParsedTime
+from src.core.prompts import load_prompt
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from src.settings import CircuitBreakerConfig
 
+# Debug logs on the per-call success path use %-style args so formatting is
+# skipped unless DEBUG is enabled; warnings/errors are emitted anyway.
 logger = logging.getLogger(__name__)
 
+# Generic key/value types for the response caches
+K = TypeVar("K")
+V = TypeVar("V")
+
 
 # ============================================================================
 # Circuit Breaker for API Resilience
@@ -83,84 +93,134 @@ class LLMCircuitBreaker:
         self._last_failure_time = 0.0
 
 
-# Global circuit breaker instance (lazy loaded with thread-safe initialization)
-_circuit_breaker: LLMCircuitBreaker | None = None
-_circuit_breaker_lock = threading.Lock()
+@cache
+def get_circuit_breaker() -> LLMCircuitBreaker:
+    """Get global circuit breaker instance.
+
+    Process-wide, built from settings on first use. Only called from the
+    event loop; functools.cache does not stop concurrent first calls from
+    other threads building a second instance.
+    """
+    from src.settings import get_settings
+
+    return LLMCircuitBreaker(get_settings().config.llm.circuit_breaker)
 
 
 def reset_circuit_breaker() -> None:
     """Reset global circuit breaker (useful for testing)."""
-    global _circuit_breaker
-    with _circuit_breaker_lock:
-        _circuit_breaker = None
+    get_circuit_breaker.cache_clear()
 
 
-def get_circuit_breaker() -> LLMCircuitBreaker:
-    """Get global circuit breaker instance.
+# Shared HTTP client for LLM API calls (lazy init). LLM calls are sparse
+# fallbacks, so idle connections are kept well past httpx's 5s default.
+LLM_HTTP_LIMITS = httpx.Limits(
+    max_connections=64, max_keepalive_connections=32, keepalive_expiry=60.0
+)
+_http_client: httpx.AsyncClient | None = None
+
 
-    Thread-safe with double-checked locking pattern.
+def _get_http_client() -> httpx.AsyncClient:
+    """Get shared HTTP client for LLM API calls.
+
+    Keeps pooled keep-alive connections so consecutive calls skip the
+    TCP+TLS handshake. Timeouts are passed per request.
     """
-    global _circuit_breaker
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(limits=LLM_HTTP_LIMITS)
+    return _http_client
 
-    # Fast path: already initialized
-    if _circuit_breaker is not None:
-        return _circuit_breaker
 
-    # Slow path: acquire lock and initialize
-    with _circuit_breaker_lock:
-        # Double-check after acquiring lock
-        if _circuit_breaker is not None:
-            return _circuit_breaker
+async def close_llm_http_client() -> None:
+    """Close the shared LLM HTTP client (call on application shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
 
-        from src.settings import get_settings
 
-        config = get_settings().config.llm.circuit_breaker
-        _circuit_breaker = LLMCircuitBreaker(config)
-        return _circuit_breaker
+# Exact-match caches for LLM answers (bounded LRU, successful calls only)
+RESPONSE_CACHE_SIZE = 1024
+_detect_cache: OrderedDict[str, bool] = OrderedDict()
+_extract_cache: OrderedDict[tuple[str, str | None, str], list[ParsedTime]] = OrderedDict()
+_tz_resolve_cache: OrderedDict[str, TzResolutionResult] = OrderedDict()
 
 
-# Load prompt templates
-DETECT_PROMPT_PATH = Path(__file__).parent.parent.parent / "prompts" / "trigger_detect.md"
-EXTRACT_PROMPT_PATH = Path(__file__).parent.parent.parent / "prompts" / "parse_time.md"
-TZ_RESOLVE_PROMPT_PATH = Path(__file__).parent.parent.parent / "prompts" / "timezone_resolve.md"
-_detect_prompt_template: Template | None = None
-_extract_prompt_template: Template | None = None
-_tz_resolve_prompt_template: Template | None = None
+def _cache_get(cache: OrderedDict[K, V], key: K) -> V | None:
+    """Return a cached value and mark it as recently used."""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
 
 
-def _get_detect_prompt_template() -> Template:
-    """Load and cache detection prompt template."""
-    global _detect_prompt_template
-    if _detect_prompt_template is None:
-        with DETECT_PROMPT_PATH.open(encoding="utf-8") as f:
-            _detect_prompt_template = Template(f.read())
-    assert _detect_prompt_template is not None
-    return _detect_prompt_template
+def _cache_put(cache: OrderedDict[K, V], key: K, value: V) -> None:
+    """Store a value, evicting the least recently used entry past the limit."""
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > RESPONSE_CACHE_SIZE:
+        cache.popitem(last=False)
 
 
-def _get_extract_prompt_template() -> Template:
-    """Load and cache extraction prompt template."""
-    global _extract_prompt_template
-    if _extract_prompt_template is None:
-        with EXTRACT_PROMPT_PATH.open(encoding="utf-8") as f:
-            _extract_prompt_template = Template(f.read())
-    assert _extract_prompt_template is not None
-    return _extract_prompt_template
+# In-flight LLM calls keyed like the caches above, so a burst of identical
+# messages shares one request instead of racing to fill the same cache entry
+_extract_inflight: dict[tuple[str, str | None, str], asyncio.Task[list[ParsedTime]]] = {}
+_tz_resolve_inflight: dict[str, asyncio.Task[TzResolutionResult]] = {}
 
 
-def _get_tz_resolve_prompt_template() -> Template:
-    """Load and cache timezone resolution prompt template."""
-    global _tz_resolve_prompt_template
-    if _tz_resolve_prompt_template is None:
-        with TZ_RESOLVE_PROMPT_PATH.open(encoding="utf-8") as f:
-            _tz_resolve_prompt_template = Template(f.read())
-    assert _tz_resolve_prompt_template is not None
-    return _tz_resolve_prompt_template
+async def _single_flight(
+    inflight: dict[K, asyncio.Task[V]], key: K, call: Callable[[], Awaitable[V]]
+) -> V:
+    """Await call() for key, joining an identical call that is already running.
+
+    The shared task is shielded so one cancelled caller does not cancel it
+    for the others.
+    """
+    task = inflight.get(key)
+    if task is None:
+
+        async def run() -> V:
+            try:
+                return await call()
+            finally:
+                if inflight.get(key) is task:
+                    del inflight[key]
+
+        task = asyncio.ensure_future(run())
+        inflight[key] = task
+    return await asyncio.shield(task)
+
+
+def clear_llm_caches() -> None:
+    """Drop all cached LLM answers (useful for testing)."""
+    _detect_cache.clear()
+    _extract_cache.clear()
+    _tz_resolve_cache.clear()
+
+
+# Cheap pre-filter: texts with none of these cannot contain a time reference.
+# Deliberately broad (number words, EOD/COB, noon) - false hits only cost an LLM call.
+# Covers every time word the classifier's trigger guard accepts (midday, midi, ...).
+_TIME_HINT_RE = re.compile(
+    r"\d"
+    r"|\b(?:a\.?m|p\.?m|noon|mid|o'?clock|half|quarter|past|morning|afternoon"
+    r"|evening|night|tonight|today|tomorrow|hour|min|eod|cob|eow"
+    r"|one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve)"
+    r"|час|минут|утр|вечер|ноч|дн[её]м|полдень|полноч|сегодня|завтра"
+    r"|один|два|двух|три|тр[её]х|четыр|пят|шест|сем|восем|девят|десят|двенадцат",
+    re.IGNORECASE,
+)
+
+# JSON object inside a markdown fence, else the outermost {...} span
+_JSON_BLOCK_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```|(\{.*\})", re.DOTALL)
 
 
 async def detect_time_with_llm(text: str) -> bool:
     """Use LLM to detect if text contains a time reference.
 
+    Texts without any time hint (_TIME_HINT_RE) are rejected without a call.
+    Answers are cached per normalized text; fail-open fallbacks are not.
+
     Args:
         text: Message text to analyze.
 
@@ -169,8 +229,22 @@ async def detect_time_with_llm(text: str) -> bool:
     """
     from src.settings import get_settings
 
+    if _TIME_HINT_RE.search(text) is None:
+        return False
+
+    cache_key = text.strip().lower()
+    cached = _cache_get(_detect_cache, cache_key)
+    if cached is not None:
+        return cached
+
     settings = get_settings()
 
+    # Check circuit breaker first
+    cb = get_circuit_breaker()
+    if cb.is_open():
+        logger.warning("LLM circuit breaker is open, falling back to uncertain=True")
+        return True  # Fail open
+
     # Check API key
     api_key = settings.nvidia_api_key
     if not api_key:
@@ -178,51 +252,60 @@ async def detect_time_with_llm(text: str) -> bool:
         return True  # Fail open - better to have false positive than miss
 
     # Build prompt
-    template = _get_detect_prompt_template()
-    prompt = template.render(message=text)
+    prompt = load_prompt("trigger_detect", message=text)
 
     # Call LLM API with detection-specific settings
     detection_config = settings.config.llm.detection
     try:
-        async with httpx.AsyncClient(timeout=detection_config.timeout) as client:
-            response = await client.post(
-                f"{settings.config.llm.base_url}/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
+        response = await _get_http_client().post(
+            f"{settings.config.llm.base_url}/chat/completions",
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+            },
+            content=orjson.dumps(
+                {
                     "model": settings.config.llm.model,
                     "messages": [{"role": "user", "content": prompt}],
                     "max_tokens": detection_config.max_tokens,
                     "temperature": detection_config.temperature,
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
+                    "response_format": {"type": "json_object"},
+                }
+            ),
+            timeout=detection_config.timeout,
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
 
         # Parse response with null guards
         content = _extract_content_from_response(data)
         if content is None:
             logger.warning("LLM response missing content")
+            cb.record_failure()
             return True  # Fail open
         result = _parse_llm_response(content)
+        cb.record_success()
+        _cache_put(_detect_cache, cache_key, result)
 
-        logger.debug(f"LLM fallback: '{text[:50]}...' -> {result}")
+        logger.debug("LLM fallback: '%.50s...' -> %s", text, result)
         return result
 
     except httpx.HTTPStatusError as e:
         logger.error(f"LLM API error: {e.response.status_code}")
+        cb.record_failure()
         return True  # Fail open
     except httpx.TimeoutException:
         logger.error("LLM API timeout")
+        cb.record_failure()
         return True  # Fail open
     except (KeyError, TypeError, ValueError) as e:
         # JSON parsing or response format issues
         logger.warning(f"LLM response parsing error: {e}")
+        cb.record_failure()
         return True  # Fail open
     except Exception as e:
         logger.exception(f"Unexpected LLM fallback error: {e}")
+        cb.record_failure()
         return True  # Fail open
 
 
@@ -248,6 +331,49 @@ def _extract_content_from_response(data: dict) -> str | None:
         return None
 
 
+def _load_json_object(content: str) -> dict:
+    """Parse the JSON object from LLM response content.
+
+    Calls are made in JSON mode, so content is normally the bare object and
+    a single orjson.loads suffices. Markdown fences or surrounding text (from
+    models that ignore response_format) are stripped as a fallback.
+
+    Args:
+        content: Raw LLM response content.
+
+    Returns:
+        Parsed JSON object.
+
+    Raises:
+        ValueError: If no JSON object can be parsed (includes JSONDecodeError).
+    """
+    try:
+        result = orjson.loads(content)
+    except orjson.JSONDecodeError:
+        json_str = _find_json_block(content)
+        if json_str is None:
+            raise
+        result = orjson.loads(json_str)
+    if not isinstance(result, dict):
+        raise ValueError(f"Expected JSON object, got {type(result).__name__}")
+    return result
+
+
+def _find_json_block(content: str) -> str | None:
+    """Locate a JSON object in markdown fences or surrounding prose.
+
+    Args:
+        content: Raw LLM response content.
+
+    Returns:
+        JSON object substring, or None if the content has no braces.
+    """
+    match = _JSON_BLOCK_RE.search(content)
+    if match is None:
+        return None
+    return match.group(1) or match.group(2)
+
+
 def _parse_llm_response(content: str) -> bool:
     """Parse LLM response to extract time detection result.
 
@@ -257,31 +383,10 @@ def _parse_llm_response(content: str) -> bool:
     Returns:
         True if LLM says contains_time is true.
     """
-    # Try to extract JSON from response
     try:
-        # Look for JSON block in markdown - use find() to avoid ValueError
-        json_str = ""
-        if "```json" in content:
-            start = content.find("```json") + 7
-            end = content.find("```", start)
-            if end > start:
-                json_str = content[start:end].strip()
-        elif "```" in content:
-            start = content.find("```") + 3
-            end = content.find("```", start)
-            if end > start:
-                json_str = content[start:end].strip()
-
-        # Fallback: find raw JSON object
-        if not json_str:
-            start = content.find("{")
-            end = content.rfind("}") + 1
-            json_str = content[start:end] if start != -1 and end > start else content
-
-        result = json.loads(json_str)
-        return bool(result.get("contains_time", False))
-
-    except (json.JSONDecodeError, ValueError) as e:
+        return bool(_load_json_object(content).get("contains_time", False))
+
+    except ValueError as e:
         logger.warning(f"Failed to parse LLM response: {e}")
         # Fallback: look for keywords, fail open (True) unless explicitly false
         content_lower = content.lower()
@@ -299,6 +404,11 @@ def _parse_llm_response(content: str) -> bool:
 async def extract_times_with_llm(text: str, tz_hint: str | None = None) -> list[ParsedTime]:
     """Use LLM to extract times when regex fails.
 
+    Texts without any time hint (_TIME_HINT_RE) return no times without a
+    call. Answers are cached per (text, tz_hint, current minute) - the same
+    inputs the prompt is rendered from - so relative times never go stale.
+    Concurrent calls with the same key share a single request.
+
     Args:
         text: Message text to parse.
         tz_hint: Optional timezone hint from context.
@@ -306,6 +416,27 @@ async def extract_times_with_llm(text: str, tz_hint: str | None = None) -> list[
     Returns:
         List of parsed times, empty if extraction fails.
     """
+    if _TIME_HINT_RE.search(text) is None:
+        return []
+
+    current_datetime = datetime.now().isoformat(timespec="minutes")
+    cache_key = (text, tz_hint, current_datetime)
+    cached = _cache_get(_extract_cache, cache_key)
+    if cached is not None:
+        return list(cached)
+
+    times = await _single_flight(
+        _extract_inflight,
+        cache_key,
+        lambda: _extract_times_uncached(text, tz_hint, current_datetime),
+    )
+    return list(times)
+
+
+async def _extract_times_uncached(
+    text: str, tz_hint: str | None, current_datetime: str
+) -> list[ParsedTime]:
+    """Call the LLM for extract_times_with_llm and cache a successful answer."""
     from src.settings import get_settings
 
     settings = get_settings()
@@ -322,32 +453,35 @@ async def extract_times_with_llm(text: str, tz_hint: str | None = None) -> list[
         return []
 
     # Build prompt
-    template = _get_extract_prompt_template()
-    prompt = template.render(
+    prompt = load_prompt(
+        "parse_time",
         message=text,
-        current_datetime=datetime.now().isoformat(),
+        current_datetime=current_datetime,
         timezone_hints=tz_hint or "none",
     )
 
     # Use extraction-specific settings
     extraction_config = settings.config.llm.extraction
     try:
-        async with httpx.AsyncClient(timeout=extraction_config.timeout) as client:
-            response = await client.post(
-                f"{settings.config.llm.base_url}/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
+        response = await _get_http_client().post(
+            f"{settings.config.llm.base_url}/chat/completions",
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+            },
+            content=orjson.dumps(
+                {
                     "model": settings.config.llm.model,
                     "messages": [{"role": "user", "content": prompt}],
                     "max_tokens": extraction_config.max_tokens,
                     "temperature": extraction_config.temperature,
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
+                    "response_format": {"type": "json_object"},
+                }
+            ),
+            timeout=extraction_config.timeout,
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
 
         content = _extract_content_from_response(data)
         if content is None:
@@ -358,8 +492,9 @@ async def extract_times_with_llm(text: str, tz_hint: str | None = None) -> list[
 
         # Record success
         cb.record_success()
+        _cache_put(_extract_cache, (text, tz_hint, current_datetime), times)
 
-        logger.debug(f"LLM extraction: '{text[:50]}...' -> {len(times)} times")
+        logger.debug("LLM extraction: '%.50s...' -> %d times", text, len(times))
         return times
 
     except httpx.HTTPStatusError as e:
@@ -392,63 +527,43 @@ def _parse_extraction_response(content: str, default_confidence: float = 0.8) ->
         List of ParsedTime objects.
     """
     try:
-        # Extract JSON from response - use find() to avoid ValueError
-        json_str = ""
-        if "```json" in content:
-            start = content.find("```json") + 7
-            end = content.find("```", start)
-            if end > start:
-                json_str = content[start:end].strip()
-        elif "```" in content:
-            start = content.find("```") + 3
-            end = content.find("```", start)
-            if end > start:
-                json_str = content[start:end].strip()
-
-        # Fallback: find raw JSON object
-        if not json_str:
-            start = content.find("{")
-            end = content.rfind("}") + 1
-            if start != -1 and end > start:
-                json_str = content[start:end]
-            else:
-                logger.warning(f"No JSON found in LLM response: {content[:200]}")
-                return []
-
-        result = json.loads(json_str)
-        times_data = result.get("times", [])
-
-        parsed: list[ParsedTime] = []
-        for t in times_data:
-            try:
-                hour = int(t.get("hour", 0))
-                minute = int(t.get("minute", 0))
-
-                # Validate hour/minute
-                if not (0 <= hour <= 23 and 0 <= minute <= 59):
-                    continue
-
-                parsed.append(
-                    ParsedTime(
-                        original_text=str(t.get("original_text", "")),
-                        hour=hour,
-                        minute=minute,
-                        timezone_hint=t.get("timezone_hint"),
-                        is_tomorrow=bool(t.get("is_tomorrow", False)),
-                        confidence=float(t.get("confidence", default_confidence)),
-                    )
-                )
-            except (KeyError, ValueError, TypeError) as e:
-                logger.warning(f"Failed to parse time entry: {e}")
-                continue
-
-        return parsed
+        result = _load_json_object(content)
+        return _parse_time_entries(result.get("times", []), default_confidence)
 
-    except (json.JSONDecodeError, ValueError) as e:
+    except ValueError as e:
         logger.warning(f"Failed to parse LLM extraction response: {e}")
         return []
 
 
+def _parse_time_entries(times_data: list, default_confidence: float) -> list[ParsedTime]:
+    """Convert the "times" entries of an extraction answer, skipping invalid ones."""
+    parsed: list[ParsedTime] = []
+    for t in times_data:
+        try:
+            hour = int(t.get("hour", 0))
+            minute = int(t.get("minute", 0))
+
+            # Validate hour/minute
+            if not (0 <= hour <= 23 and 0 <= minute <= 59):
+                continue
+
+            parsed.append(
+                ParsedTime(
+                    original_text=str(t.get("original_text", "")),
+                    hour=hour,
+                    minute=minute,
+                    timezone_hint=t.get("timezone_hint"),
+                    is_tomorrow=bool(t.get("is_tomorrow", False)),
+                    confidence=float(t.get("confidence", default_confidence)),
+                )
+            )
+        except (AttributeError, KeyError, ValueError, TypeError) as e:
+            logger.warning(f"Failed to parse time entry: {e}")
+            continue
+
+    return parsed
+
+
 # ============================================================================
 # Timezone Resolution (when explicit TZ unclear or clarification needed)
 # ============================================================================
@@ -474,7 +589,9 @@ async def resolve_timezone_context(
     """Use LLM to resolve which timezone a time reference is in.
 
     Determines whether user is speaking about their own timezone
-    or explicitly mentioning a specific timezone.
+    or explicitly mentioning a specific timezone. Successful answers are
+    cached per rendered prompt (the prompt has no clock-dependent parts),
+    and concurrent calls with the same prompt share a single request.
 
     Args:
         message: Current message with time reference.
@@ -512,34 +629,56 @@ async def resolve_timezone_context(
         )
 
     # Build prompt
-    template = _get_tz_resolve_prompt_template()
-    prompt = template.render(
+    prompt = load_prompt(
+        "timezone_resolve",
         message=message,
         recent_messages=recent_messages or [],
         detected_times=detected_times or [],
         user_tz=user_tz or "unknown",
         chat_tzs=chat_tzs or [],
     )
+    cached = _cache_get(_tz_resolve_cache, prompt)
+    if cached is not None:
+        return cached
+
+    return await _single_flight(
+        _tz_resolve_inflight,
+        prompt,
+        lambda: _resolve_timezone_uncached(prompt, message, user_tz),
+    )
+
+
+async def _resolve_timezone_uncached(
+    prompt: str, message: str, user_tz: str | None
+) -> TzResolutionResult:
+    """Call the LLM for resolve_timezone_context and cache a successful answer."""
+    from src.settings import get_settings
+
+    settings = get_settings()
+    cb = get_circuit_breaker()
+    api_key = settings.nvidia_api_key
 
     # Use extraction config (similar complexity)
     extraction_config = settings.config.llm.extraction
     try:
-        async with httpx.AsyncClient(timeout=extraction_config.timeout) as client:
-            response = await client.post(
-                f"{settings.config.llm.base_url}/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
+        response = await _get_http_client().post(
+            f"{settings.config.llm.base_url}/chat/completions",
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+            },
+            content=orjson.dumps(
+                {
                     "model": settings.config.llm.model,
                     "messages": [{"role": "user", "content": prompt}],
                     "max_tokens": extraction_config.max_tokens,
                     "temperature": extraction_config.temperature,
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
+                }
+            ),
+            timeout=extraction_config.timeout,
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
 
         content = _extract_content_from_response(data)
         if content is None:
@@ -552,13 +691,26 @@ async def resolve_timezone_context(
                 reasoning="API response missing content",
             )
         result = _parse_tz_resolution_response(content, user_tz)
+        if result is None:
+            # Malformed answer: fall back to the user's timezone, but don't
+            # cache it - the next attempt may get a usable response
+            cb.record_failure()
+            return TzResolutionResult(
+                source_tz=user_tz,
+                is_user_tz=True,
+                confidence=0.4,
+                reasoning="Failed to parse response",
+            )
 
         # Record success
         cb.record_success()
+        _cache_put(_tz_resolve_cache, prompt, result)
 
         logger.debug(
-            f"LLM TZ resolution: '{message[:50]}...' -> "
-            f"{result.source_tz} (is_user_tz={result.is_user_tz})"
+            "LLM TZ resolution: '%.50s...' -> %s (is_user_tz=%s)",
+            message,
+            result.source_tz,
+            result.is_user_tz,
         )
         return result
 
@@ -601,46 +753,24 @@ async def resolve_timezone_context(
         )
 
 
-def _parse_tz_resolution_response(content: str, fallback_tz: str | None) -> TzResolutionResult:
+def _parse_tz_resolution_response(
+    content: str, fallback_tz: str | None
+) -> TzResolutionResult | None:
     """Parse LLM timezone resolution response.
 
     Args:
         content: Raw LLM response content.
-        fallback_tz: Fallback timezone if parsing fails.
+        fallback_tz: Timezone used when the response omits source_tz.
 
     Returns:
-        TzResolutionResult parsed from response.
+        TzResolutionResult parsed from response, or None if it can't be parsed.
     """
-    try:
-        # Extract JSON from response
-        json_str = ""
-        if "```json" in content:
-            start = content.find("```json") + 7
-            end = content.find("```", start)
-            if end > start:
-                json_str = content[start:end].strip()
-        elif "```" in content:
-            start = content.find("```") + 3
-            end = content.find("```", start)
-            if end > start:
-                json_str = content[start:end].strip()
-
-        # Fallback: find raw JSON object
-        if not json_str:
-            start = content.find("{")
-            end = content.rfind("}") + 1
-            if start != -1 and end > start:
-                json_str = content[start:end]
-            else:
-                logger.warning(f"No JSON found in TZ resolution response: {content[:200]}")
-                return TzResolutionResult(
-                    source_tz=fallback_tz,
-                    is_user_tz=True,
-                    confidence=0.4,
-                    reasoning="Failed to parse response",
-                )
+    if "{" not in content:
+        logger.warning(f"No JSON found in TZ resolution response: {content[:200]}")
+        return None
 
-        result = json.loads(json_str)
+    try:
+        result = _load_json_object(content)
 
         return TzResolutionResult(
             source_tz=result.get("source_tz") or fallback_tz,
@@ -649,11 +779,6 @@ def _parse_tz_resolution_response(content: str, fallback_tz: str | None) -> TzRe
             reasoning=str(result.get("reasoning", "")),
         )
 
-    except (json.JSONDecodeError, ValueError, TypeError) as e:
+    except (ValueError, TypeError) as e:
         logger.warning(f"Failed to parse TZ resolution response: {e}")
-        return TzResolutionResult(
-            source_tz=fallback_tz,
-            is_user_tz=True,
-            confidence=0.4,
-            reasoning=f"Parse error: {e}",
-        )
+        return None
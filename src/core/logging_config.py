@@ -5,26 +5,162 @@ Provides consistent JSON logging with correlation IDs for request tracing.
 
 from __future__ import annotations
 
+import atexit
 import logging
 import os
+import queue
 import sys
-from typing import Any
+import threading
+from typing import TYPE_CHECKING, Any
 
+import orjson
 import structlog
 from structlog.contextvars import bind_contextvars, clear_contextvars, merge_contextvars
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import BinaryIO
+
 # Re-export for convenience
 __all__ = [
     "bind_contextvars",
     "clear_contextvars",
     "configure_logging",
+    "flush_logs",
     "get_logger",
 ]
 
+# Rendered JSON lines waiting for the background writer; when full, callers
+# write synchronously instead of dropping records
+LOG_QUEUE_SIZE = 10_000
+# Lines the writer coalesces into a single write call
+LOG_WRITE_BATCH = 64
+# Longest flush_logs()/shutdown waits for the writer before giving up
+LOG_FLUSH_TIMEOUT = 5.0
+
+
+class _BackgroundWriter:
+    """Drains rendered log lines to a binary stream from a daemon thread."""
+
+    def __init__(self, file: BinaryIO) -> None:
+        self._file = file
+        self._queue: queue.Queue[bytes | None] = queue.Queue(LOG_QUEUE_SIZE)
+        self._write_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, line: bytes) -> None:
+        """Queue a line for writing, or write it now if the queue is full."""
+        try:
+            self._queue.put_nowait(line)
+        except queue.Full:
+            self._write([line])
+
+    def retarget(self, file: BinaryIO) -> None:
+        """Send lines queued from now on to ``file``, draining earlier ones first."""
+        self.flush()
+        with self._write_lock:
+            self._file = file
+
+    def flush(self, timeout: float = LOG_FLUSH_TIMEOUT) -> None:
+        """Wait until every queued line has been written, at most ``timeout`` seconds."""
+        if not self._thread.is_alive():
+            return
+        with self._queue.all_tasks_done:
+            self._queue.all_tasks_done.wait_for(
+                lambda: not self._queue.unfinished_tasks, timeout=timeout
+            )
+
+    def close(self, timeout: float = LOG_FLUSH_TIMEOUT) -> None:
+        """Write what is queued and stop the thread."""
+        if not self._thread.is_alive():
+            return
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < LOG_WRITE_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            lines = [line for line in batch if line is not None]
+            try:
+                if lines:
+                    self._write(lines)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if len(lines) < len(batch):
+                return
+
+    def _write(self, lines: list[bytes]) -> None:
+        # A closed or broken stdout must not kill the writer or the caller;
+        # the lines are dropped, as stdlib handlers do
+        with self._write_lock:
+            try:
+                self._file.write(b"\n".join(lines) + b"\n")
+                self._file.flush()
+            except (OSError, ValueError):
+                pass
+
+
+class _QueuedBytesLogger:
+    """structlog logger that hands rendered bytes to the background writer."""
+
+    def __init__(self, writer: _BackgroundWriter) -> None:
+        self._writer = writer
+
+    def msg(self, message: bytes) -> None:
+        self._writer.put(message)
+
+    log = debug = info = warn = warning = msg
+    fatal = failure = err = error = critical = exception = msg
+
+
+class _QueuedBytesLoggerFactory:
+    """Logger factory producing _QueuedBytesLogger instances for one writer."""
+
+    def __init__(self, writer: _BackgroundWriter) -> None:
+        self._writer = writer
+
+    def __call__(self, *_args: Any) -> _QueuedBytesLogger:
+        return _QueuedBytesLogger(self._writer)
+
+
+_writer: _BackgroundWriter | None = None
+
+
+def _get_writer(file: BinaryIO) -> _BackgroundWriter:
+    """Return the process-wide background writer, pointed at ``file``.
+
+    Loggers cached on first use keep their writer across reconfiguration,
+    so the writer is reused and only its stream is swapped.
+    """
+    global _writer
+    if _writer is None:
+        _writer = _BackgroundWriter(file)
+        atexit.register(flush_logs)
+    else:
+        _writer.retarget(file)
+    return _writer
+
+
+def flush_logs() -> None:
+    """Wait until queued JSON log lines have been written to stdout."""
+    if _writer is not None:
+        _writer.flush()
+
 
 def configure_logging(
     level: str = "INFO",
     json_output: bool | None = None,
+    context_vars: bool = True,
 ) -> None:
     """Configure structlog for the application.
 
@@ -32,13 +168,17 @@ def configure_logging(
         level: Logging level (DEBUG, INFO, WARNING, ERROR).
         json_output: If True, output JSON. If False, output colored console.
                      If None, auto-detect (JSON in production, console in dev).
+        context_vars: Merge variables bound with bind_contextvars into every
+                      event. Scripts that never bind request context can turn
+                      this off to skip the per-call context copy.
     """
     # Auto-detect output format based on environment
     if json_output is None:
         # Use JSON in production (when not running in a TTY)
         json_output = not sys.stderr.isatty() or os.getenv("LOG_FORMAT") == "json"
 
-    # Configure standard library logging to work with structlog
+    # Configure standard library logging for modules still on logging.getLogger;
+    # structlog loggers below write directly and never pass through it
     logging.basicConfig(
         format="%(message)s",
         level=getattr(logging, level.upper(), logging.INFO),
@@ -48,25 +188,35 @@ def configure_logging(
     # Build processor chain
     shared_processors: list[structlog.types.Processor] = [
         # Add log level
-        structlog.stdlib.add_log_level,
-        # Merge bound context variables
-        merge_contextvars,
+        structlog.processors.add_log_level,
         # Add timestamp
         structlog.processors.TimeStamper(fmt="iso"),
-        # Add caller info (module, function, line)
-        structlog.processors.CallsiteParameterAdder(
-            [
-                structlog.processors.CallsiteParameter.MODULE,
-                structlog.processors.CallsiteParameter.FUNC_NAME,
-            ]
-        ),
         # Render exceptions as strings
         structlog.processors.format_exc_info,
     ]
 
+    if context_vars:
+        # Merge bound context variables
+        shared_processors.insert(1, merge_contextvars)
+
+    if level.upper() == "DEBUG":
+        # Add caller info (module, function); walks the stack on every call
+        shared_processors.insert(
+            -1,
+            structlog.processors.CallsiteParameterAdder(
+                [
+                    structlog.processors.CallsiteParameter.MODULE,
+                    structlog.processors.CallsiteParameter.FUNC_NAME,
+                ]
+            ),
+        )
+
+    logger_factory: Callable[..., Any]
     if json_output:
-        # JSON output for production
-        shared_processors.append(structlog.processors.JSONRenderer())
+        # JSON output for production: orjson renders bytes, and a background
+        # thread writes them so request handlers never block on stdout
+        shared_processors.append(structlog.processors.JSONRenderer(serializer=orjson.dumps))
+        logger_factory = _QueuedBytesLoggerFactory(_get_writer(sys.stdout.buffer))
     else:
         # Colored console output for development
         shared_processors.append(
@@ -75,6 +225,7 @@ def configure_logging(
                 exception_formatter=structlog.dev.plain_traceback,
             )
         )
+        logger_factory = structlog.PrintLoggerFactory()
 
     structlog.configure(
         processors=shared_processors,
@@ -82,7 +233,7 @@ def configure_logging(
             getattr(logging, level.upper(), logging.INFO)
         ),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
 
@@ -5,7 +5,7 @@ Platform-agnostic data structures used across all connectors.
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import Enum
 from typing import Any, Generic, Literal, TypeVar
 
@@ -15,6 +15,11 @@ from pydantic import BaseModel, Field
 T = TypeVar("T")
 
 
+def _utcnow() -> datetime:
+    """Timezone-aware current UTC time (default for model timestamps)."""
+    return datetime.now(UTC)
+
+
 class Platform(str, Enum):
     """Supported messaging platforms."""
 
@@ -41,7 +46,7 @@ class NormalizedEvent(BaseModel, frozen=True):
     username: str | None = Field(default=None, description="Username if available")
     display_name: str | None = Field(default=None, description="Display name if available")
     text: str = Field(description="Message text content")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
     reply_to_message_id: str | None = Field(
         default=None, description="ID of message being replied to"
     )
@@ -110,8 +115,8 @@ class UserTzState(BaseModel):
     tz_iana: str | None = Field(default=None, description="IANA timezone identifier")
     confidence: float = Field(default=0.0, ge=0.0, le=1.0)
     source: TimezoneSource = TimezoneSource.DEFAULT
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
     last_verified_at: datetime | None = None
 
 
@@ -130,8 +135,8 @@ class ChatState(BaseModel):
     active_timezones: list[str] = Field(
         default_factory=list, description="Computed from user_timezones values (unique)"
     )
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
 
 
 class DedupeEvent(BaseModel, frozen=True):
@@ -143,11 +148,11 @@ class DedupeEvent(BaseModel, frozen=True):
     platform: Platform
     event_id: str
     chat_id: str
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
 
 
-class HandlerResult(BaseModel):
-    """Result from the core message handler."""
+class HandlerResult(BaseModel, frozen=True):
+    """Result from the core message handler. Frozen: results may be shared."""
 
     should_respond: bool = True
     messages: list[OutboundMessage] = Field(default_factory=list)
@@ -161,7 +166,7 @@ class VerifyToken(BaseModel, frozen=True):
     platform: Platform
     user_id: str
     chat_id: str
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
     expires_at: datetime
 
 
@@ -219,8 +224,8 @@ class Session(BaseModel):
         default=None, description="ID of bot's last message for reply detection"
     )
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
     expires_at: datetime = Field(description="Session expiration time (TTL)")
 
 
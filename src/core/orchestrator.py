@@ -8,12 +8,13 @@ The orchestrator is the main entry point for message processing:
 
 from __future__ import annotations
 
-import logging
+import asyncio
+import secrets
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
-from uuid import uuid4
 
 from src.core.dedupe import DedupeManager
+from src.core.logging_config import get_logger
 from src.core.models import (
     HandlerResult,
     NormalizedEvent,
@@ -34,7 +35,10 @@ if TYPE_CHECKING:
     from src.core.pipeline import Pipeline
     from src.storage.mongo import MongoStorage
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
+
+# Shared result for dropped events (duplicate, throttled, silently rate limited)
+_NO_RESPONSE = HandlerResult(should_respond=False)
 
 
 class MessageOrchestrator:
@@ -72,6 +76,7 @@ class MessageOrchestrator:
         self.base_url = base_url
         self.dedupe = DedupeManager(storage)
         self._settings = get_settings()
+        self._rate_limiter = get_rate_limit_manager()
 
     async def route(self, event: NormalizedEvent) -> HandlerResult:
         """Route an incoming message to the appropriate handler.
@@ -82,35 +87,42 @@ class MessageOrchestrator:
         Returns:
             HandlerResult from the appropriate handler.
         """
-        # 1. Check for active session
-        session = await self.storage.get_active_session(
-            event.platform, event.chat_id, event.user_id
+        # 1. Check for active session (dedupe lookup runs concurrently - both are reads)
+        session, is_duplicate = await asyncio.gather(
+            self.storage.get_active_session(event.platform, event.chat_id, event.user_id),
+            self.dedupe.is_duplicate(event.platform, event.event_id),
         )
 
         if session:
             logger.debug(
-                f"Active session found for user {event.user_id}, "
-                f"routing to agent handler (goal: {session.goal})"
+                "Active session found, routing to agent handler",
+                user_id=event.user_id,
+                goal=session.goal,
             )
             return await self.agent_handler.handle(session, event)
 
         # 2. Dedupe check
-        if await self.dedupe.is_duplicate(event.platform, event.event_id):
-            logger.debug(f"Duplicate event: {event.event_id}")
-            return HandlerResult(should_respond=False)
+        if is_duplicate:
+            logger.debug("Duplicate event", event_id=event.event_id)
+            return _NO_RESPONSE
 
         # 3. Throttle check
         if self.dedupe.is_throttled(event.platform, event.chat_id):
-            logger.debug(f"Throttled chat: {event.chat_id}")
-            return HandlerResult(should_respond=False)
+            logger.debug("Throttled chat", chat_id=event.chat_id)
+            return _NO_RESPONSE
 
         # 4. Rate limit check
-        rate_limiter = get_rate_limit_manager()
+        rate_limiter = self._rate_limiter
         is_allowed, limit_type = rate_limiter.check_rate_limit(
             event.platform.value, event.user_id, event.chat_id
         )
         if not is_allowed:
-            logger.info(f"Rate limited ({limit_type}): user={event.user_id} chat={event.chat_id}")
+            logger.info(
+                "Rate limited",
+                limit_type=limit_type,
+                user_id=event.user_id,
+                chat_id=event.chat_id,
+            )
 
             # Notify user about rate limit (first N times, then stay silent)
             if rate_limiter.should_notify_rate_limit(event.platform.value, event.user_id):
@@ -127,10 +139,10 @@ class MessageOrchestrator:
                 )
                 return HandlerResult(should_respond=True, messages=[message])
 
-            return HandlerResult(should_respond=False)
+            return _NO_RESPONSE
 
         # 5. Process through pipeline (detection + context + action handlers)
-        logger.debug(f"Processing event through pipeline for user {event.user_id}")
+        logger.debug("Processing event through pipeline", user_id=event.user_id)
         result = await self.pipeline.process(event)
 
         # 6. Decide what to do with triggers
@@ -139,23 +151,21 @@ class MessageOrchestrator:
             action = self._decide_action(trigger, result)
 
             if action == "send_help":
-                logger.info(f"Help request from user {event.user_id}")
+                logger.info("Help request", user_id=event.user_id)
                 return await self._send_help_message(event)
 
             elif action == "create_relocation_session":
-                logger.info(f"Relocation detected for user {event.user_id}")
+                logger.info("Relocation detected", user_id=event.user_id)
                 # Reset confidence via relocation handler
                 await self._reset_user_confidence(event)
                 return await self._handle_relocation(event, trigger)
 
             elif action == "create_timezone_session":
-                logger.info(f"Timezone session needed for user {event.user_id}")
+                logger.info("Timezone session needed", user_id=event.user_id)
                 return await self._create_timezone_session(event, trigger)
 
             elif action == "classify_geo_intent":
-                logger.info(
-                    f"Geo ambiguous trigger for user {event.user_id}, creating agent session"
-                )
+                logger.info("Geo ambiguous trigger, creating agent session", user_id=event.user_id)
                 return await self._handle_geo_ambiguous(event, trigger, result.triggers)
 
         # 7. If we have messages from handlers, return them
@@ -294,8 +304,9 @@ class MessageOrchestrator:
             text = get_ui_message("onboarding")
 
         # Create session (is_reverify stored in context for agent)
+        now = datetime.now(UTC)
         session = Session(
-            session_id=str(uuid4()),
+            session_id=secrets.token_hex(16),
             platform=event.platform,
             chat_id=event.chat_id,
             user_id=event.user_id,
@@ -310,14 +321,16 @@ class MessageOrchestrator:
                 "existing_tz": existing_tz,
                 "is_reverify": is_reverify,
             },
-            created_at=datetime.now(UTC),
-            updated_at=datetime.now(UTC),
-            expires_at=datetime.now(UTC) + timedelta(minutes=SESSION_TTL_TIMEZONE_MINUTES),
+            created_at=now,
+            updated_at=now,
+            expires_at=now + timedelta(minutes=SESSION_TTL_TIMEZONE_MINUTES),
         )
         await self.storage.create_session(session)
         logger.info(
-            f"Created {'re-verify' if is_reverify else 'onboarding'} "
-            f"session {session.session_id} for user {event.user_id}"
+            "Created timezone session",
+            kind="re-verify" if is_reverify else "onboarding",
+            session_id=session.session_id,
+            user_id=event.user_id,
         )
 
         message = OutboundMessage(
@@ -353,7 +366,7 @@ class MessageOrchestrator:
         result = geocode_city(city, use_llm=True)
         if result:
             resolved_city, resolved_tz = result
-            logger.info(f"Geocode success: '{city}' → {resolved_city} ({resolved_tz})")
+            logger.info("Geocode success", city=city, resolved_city=resolved_city, tz=resolved_tz)
             return result
         return None
 
@@ -378,8 +391,9 @@ class MessageOrchestrator:
         Returns:
             HandlerResult with confirmation prompt.
         """
+        now = datetime.now(UTC)
         session = Session(
-            session_id=str(uuid4()),
+            session_id=secrets.token_hex(16),
             platform=event.platform,
             chat_id=event.chat_id,
             user_id=event.user_id,
@@ -392,14 +406,17 @@ class MessageOrchestrator:
                 "resolved_tz": resolved_tz,
                 "attempts": 0,
             },
-            created_at=datetime.now(UTC),
-            updated_at=datetime.now(UTC),
-            expires_at=datetime.now(UTC) + timedelta(minutes=SESSION_TTL_TIMEZONE_MINUTES),
+            created_at=now,
+            updated_at=now,
+            expires_at=now + timedelta(minutes=SESSION_TTL_TIMEZONE_MINUTES),
         )
         await self.storage.create_session(session)
         logger.info(
-            f"Created confirm_relocation session {session.session_id} for user {event.user_id}: "
-            f"{resolved_city} → {resolved_tz}"
+            "Created confirm_relocation session",
+            session_id=session.session_id,
+            user_id=event.user_id,
+            city=resolved_city,
+            tz=resolved_tz,
         )
 
         # Send confirmation message
@@ -453,8 +470,9 @@ class MessageOrchestrator:
         user_tz = user_state.tz_iana if user_state else None
 
         # Create session with full context for the agent
+        now = datetime.now(UTC)
         session = Session(
-            session_id=str(uuid4()),
+            session_id=secrets.token_hex(16),
             platform=event.platform,
             chat_id=event.chat_id,
             user_id=event.user_id,
@@ -474,14 +492,17 @@ class MessageOrchestrator:
                 "attempts": 0,
                 "history": [],
             },
-            created_at=datetime.now(UTC),
-            updated_at=datetime.now(UTC),
-            expires_at=datetime.now(UTC) + timedelta(minutes=SESSION_TTL_GEO_INTENT_MINUTES),
+            created_at=now,
+            updated_at=now,
+            expires_at=now + timedelta(minutes=SESSION_TTL_GEO_INTENT_MINUTES),
         )
         await self.storage.create_session(session)
         logger.info(
-            f"Created CLARIFY_GEO_INTENT session {session.session_id} for user {event.user_id}: "
-            f"city={city}, time_detected={time_detected}"
+            "Created CLARIFY_GEO_INTENT session",
+            session_id=session.session_id,
+            user_id=event.user_id,
+            city=city,
+            time_detected=time_detected,
         )
 
         # Let the agent handler process immediately with the initial message
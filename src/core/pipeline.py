@@ -6,6 +6,7 @@ using the extensible architecture components.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING
 
@@ -57,6 +58,9 @@ class Pipeline:
         self.action_handlers: Mapping[str, ActionHandler] = action_handlers or {}
         self.storage = storage
         self._settings = get_settings()
+        # Team timezones are fixed for the process - bind them once
+        self._team_timezones = self._settings.config.timezone.team_timezones
+        self._team_timezone_set = frozenset(self._team_timezones)
 
     async def process(self, event: NormalizedEvent) -> PipelineResult:
         """Process a normalized event through the pipeline.
@@ -110,7 +114,7 @@ class Pipeline:
                     logger.error(f"Handler for {trigger.trigger_type} failed: {e}")
                     errors.append(f"Handler error: {e}")
             else:
-                logger.debug(f"No handler registered for trigger type: {trigger.trigger_type}")
+                logger.debug("No handler registered for trigger type: %s", trigger.trigger_type)
 
         return PipelineResult(
             triggers=all_triggers,
@@ -141,36 +145,16 @@ class Pipeline:
         # Track if source TZ is explicit (from message) vs user default
         is_explicit_source_tz = timezone_hint is not None
 
-        # Resolve user's timezone
-        source_timezone = timezone_hint
-        if not source_timezone and "timezone" in self.state_managers:
-            try:
-                tz_state = await self.state_managers["timezone"].get_state(
-                    platform=event.platform,
-                    user_id=event.user_id,
-                    chat_id=event.chat_id,
-                )
-                source_timezone = tz_state.value
-            except Exception as e:
-                logger.error(f"Failed to get timezone state: {e}")
-
-        # Get target timezones: config + chat's detected timezones
-        config_timezones = self._settings.config.timezone.team_timezones
-        chat_timezones: list[str] = []
-
-        # Get chat's active timezones from storage
-        if self.storage:
-            try:
-                chat_state = await self.storage.get_chat_state(event.platform, event.chat_id)
-                if chat_state and chat_state.active_timezones:
-                    chat_timezones = chat_state.active_timezones
-            except Exception as e:
-                logger.error(f"Failed to get chat timezones: {e}")
+        # User timezone and chat timezones are independent reads - overlap them
+        source_timezone, chat_timezones = await asyncio.gather(
+            self._resolve_source_timezone(event, timezone_hint),
+            self._get_chat_timezones(event),
+        )
 
-        # Merge: config first, then chat-specific
+        # Target timezones: config first, then chat-specific
         from src.core.chat_timezones import merge_timezones
 
-        target_timezones = merge_timezones(config_timezones, chat_timezones)
+        target_timezones = merge_timezones(self._team_timezones, chat_timezones)
 
         return ResolvedContext(
             platform=event.platform,
@@ -179,6 +163,52 @@ class Pipeline:
             source_timezone=source_timezone,
             is_explicit_source_tz=is_explicit_source_tz,
             target_timezones=target_timezones,
-            team_timezones=frozenset(config_timezones),
+            team_timezones=self._team_timezone_set,
             reply_to_message_id=event.message_id,
         )
+
+    async def _resolve_source_timezone(
+        self, event: NormalizedEvent, timezone_hint: str | None
+    ) -> str | None:
+        """Resolve the source timezone: explicit hint first, then user's state.
+
+        Args:
+            event: The normalized event.
+            timezone_hint: Timezone mentioned in the message, if any.
+
+        Returns:
+            IANA timezone or None if unknown.
+        """
+        if timezone_hint or "timezone" not in self.state_managers:
+            return timezone_hint
+
+        try:
+            tz_state = await self.state_managers["timezone"].get_state(
+                platform=event.platform,
+                user_id=event.user_id,
+                chat_id=event.chat_id,
+            )
+            return tz_state.value
+        except Exception as e:
+            logger.error(f"Failed to get timezone state: {e}")
+            return None
+
+    async def _get_chat_timezones(self, event: NormalizedEvent) -> list[str]:
+        """Get chat's active timezones from storage.
+
+        Args:
+            event: The normalized event.
+
+        Returns:
+            Active timezones for the chat (empty if none or on error).
+        """
+        if not self.storage:
+            return []
+
+        try:
+            chat_state = await self.storage.get_chat_state(event.platform, event.chat_id)
+            if chat_state and chat_state.active_timezones:
+                return chat_state.active_timezones
+        except Exception as e:
+            logger.error(f"Failed to get chat timezones: {e}")
+        return []
@@ -5,16 +5,36 @@ Centralizes prompt loading and caching for consistent template management.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Template
+from jinja2 import Environment, FileSystemLoader, TemplateNotFound
 
 # Prompts directory relative to repository root
 PROMPTS_DIR = Path(__file__).parent.parent.parent / "prompts"
 
-# Template cache
-_template_cache: dict[str, Template] = {}
+# Shared environment: each template is compiled once per process, and with
+# auto_reload off cached templates are never re-checked against the files
+_env = Environment(
+    loader=FileSystemLoader(PROMPTS_DIR, encoding="utf-8"),
+    cache_size=-1,
+    auto_reload=False,
+)
+
+# Rendered text of prompts loaded without variables (always the same output)
+_static_prompt_cache: dict[str, str] = {}
+
+# UI messages whose variables are timezones or resolved city names - few
+# distinct values. Others carry raw user text or per-user URLs and are
+# rendered directly so they don't churn the cache
+CACHED_UI_MESSAGES = frozenset({"confirm_relocation", "reverify", "saved"})
+
+# Rendered UI messages keyed by name and string variables (LRU, in-process)
+UI_MESSAGE_CACHE_SIZE = 256
+
+# Rendered agent system prompts keyed by timezone - a few hundred IANA zones
+AGENT_PROMPT_CACHE_SIZE = 512
 
 
 def load_prompt(name: str, **variables: Any) -> str:
@@ -30,17 +50,20 @@ def load_prompt(name: str, **variables: Any) -> str:
     Raises:
         FileNotFoundError: If prompt file doesn't exist.
     """
-    # Get cached template or load from file
-    if name not in _template_cache:
-        prompt_path = PROMPTS_DIR / f"{name}.md"
-        if not prompt_path.exists():
-            raise FileNotFoundError(f"Prompt not found: {prompt_path}")
-
-        with prompt_path.open(encoding="utf-8") as f:
-            _template_cache[name] = Template(f.read())
+    try:
+        template = _env.get_template(f"{name}.md")
+    except TemplateNotFound as e:
+        raise FileNotFoundError(f"Prompt not found: {PROMPTS_DIR / f'{name}.md'}") from e
+
+    # Static prompts (most UI messages) are rendered once
+    if not variables:
+        rendered = _static_prompt_cache.get(name)
+        if rendered is None:
+            rendered = _static_prompt_cache[name] = template.render().strip()
+        return rendered
 
     # Render template with variables
-    return _template_cache[name].render(**variables).strip()
+    return template.render(**variables).strip()
 
 
 def get_agent_system_prompt(current_tz: str | None = None) -> str:
@@ -52,7 +75,7 @@ def get_agent_system_prompt(current_tz: str | None = None) -> str:
     Returns:
         Rendered system prompt.
     """
-    return load_prompt("agent_timezone", current_tz=current_tz)
+    return _render_agent_prompt(current_tz)
 
 
 def get_ui_message(name: str, **variables: Any) -> str:
@@ -65,4 +88,18 @@ def get_ui_message(name: str, **variables: Any) -> str:
     Returns:
         Rendered UI message.
     """
+    if name in CACHED_UI_MESSAGES and all(isinstance(v, str) for v in variables.values()):
+        return _render_ui_message(name, tuple(sorted(variables.items())))
     return load_prompt(f"ui/{name}", **variables)
+
+
+@lru_cache(maxsize=AGENT_PROMPT_CACHE_SIZE)
+def _render_agent_prompt(current_tz: str | None) -> str:
+    """Render the agent system prompt once per timezone (memoized)."""
+    return load_prompt("agent_timezone", current_tz=current_tz)
+
+
+@lru_cache(maxsize=UI_MESSAGE_CACHE_SIZE)
+def _render_ui_message(name: str, variables: tuple[tuple[str, str], ...]) -> str:
+    """Render a UI message with string variables (memoized by get_ui_message)."""
+    return load_prompt(f"ui/{name}", **dict(variables))
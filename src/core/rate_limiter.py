@@ -9,7 +9,7 @@ rate limiting to ensure consistency across workers.
 
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import defaultdict, deque
 from time import time
 from typing import TYPE_CHECKING
 
@@ -42,7 +42,8 @@ class RateLimiter:
             config: Rate limit configuration with requests and window_seconds.
         """
         self.config = config
-        self._requests: dict[str, list[float]] = defaultdict(list)
+        # Timestamps per key, oldest first - expired ones are popped from the left
+        self._requests: dict[str, deque[float]] = defaultdict(deque)
         self._cleanup_counter = 0
 
     def is_allowed(self, key: str) -> bool:
@@ -61,15 +62,12 @@ class RateLimiter:
             self._cleanup_counter = 0
 
         now = time()
-        cutoff = now - self.config.window_seconds
-
-        # Remove expired entries
-        self._requests[key] = [t for t in self._requests[key] if t > cutoff]
+        timestamps = self._prune(key, now)
 
-        if len(self._requests[key]) >= self.config.requests:
+        if len(timestamps) >= self.config.requests:
             return False
 
-        self._requests[key].append(now)
+        timestamps.append(now)
         return True
 
     def get_retry_after(self, key: str) -> int:
@@ -85,14 +83,20 @@ class RateLimiter:
             return 0
 
         now = time()
-        cutoff = now - self.config.window_seconds
-        valid_requests = [t for t in self._requests[key] if t > cutoff]
+        timestamps = self._prune(key, now)
 
-        if len(valid_requests) < self.config.requests:
+        if len(timestamps) < self.config.requests:
             return 0
 
-        oldest = min(valid_requests)
-        return max(0, int(self.config.window_seconds - (now - oldest)))
+        return max(0, int(self.config.window_seconds - (now - timestamps[0])))
+
+    def _prune(self, key: str, now: float) -> deque[float]:
+        """Drop timestamps that fell out of the window and return the rest."""
+        cutoff = now - self.config.window_seconds
+        timestamps = self._requests[key]
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
+        return timestamps
 
     def reset(self, key: str) -> None:
         """Reset rate limit for a key.
@@ -116,7 +120,7 @@ class RateLimiter:
         keys_to_remove = [
             key
             for key, timestamps in list(self._requests.items())
-            if not timestamps or max(timestamps) < cutoff
+            if not timestamps or timestamps[-1] < cutoff
         ]
         for key in keys_to_remove:
             del self._requests[key]
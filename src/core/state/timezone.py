@@ -15,6 +15,9 @@ from src.settings import get_settings
 if TYPE_CHECKING:
     from src.storage.mongo import MongoStorage
 
+# Source string → TimezoneSource (dict lookup avoids Enum's ValueError path)
+_TIMEZONE_SOURCES: dict[str, TimezoneSource] = {source.value: source for source in TimezoneSource}
+
 
 class TimezoneStateManager:
     """Manages user timezone state.
@@ -121,10 +124,7 @@ class TimezoneStateManager:
         from src.core.models import UserTzState
 
         # Map source string to TimezoneSource enum
-        try:
-            source_enum = TimezoneSource(source)
-        except ValueError:
-            source_enum = TimezoneSource.DEFAULT
+        source_enum = _TIMEZONE_SOURCES.get(source, TimezoneSource.DEFAULT)
 
         now = datetime.now(UTC)
         state = UserTzState(
@@ -6,21 +6,52 @@ Simple, fast (<1ms inference), no neural networks needed.
 
 from __future__ import annotations
 
+import asyncio
 import csv
+import logging
+import math
 import pickle
 import re
+import threading
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from sklearn.feature_extraction.text import TfidfVectorizer
     from sklearn.linear_model import LogisticRegression
 
+logger = logging.getLogger(__name__)
+
 # Paths
 TRAIN_PATH = Path(__file__).parent.parent.parent / "data" / "time_extraction_train.csv"
 MODEL_PATH = Path(__file__).parent.parent.parent / "data" / "time_classifier.pkl"
 
 
+# Distinct words whose vocabulary n-grams are memoized per loaded model
+WORD_NGRAM_CACHE_SIZE = 8192
+
+
+def _vocabulary_ngrams(
+    word: str, vocabulary: dict[str, tuple[float, float]], min_n: int, max_n: int
+) -> tuple[str, ...]:
+    """Char n-grams of one word, as sklearn's char_wb analyzer emits them, kept if in vocabulary."""
+    padded = f" {word} "
+    hits: list[str] = []
+    for n in range(min_n, max_n + 1):
+        last = len(padded) - n
+        for offset in range(max(last, 0) + 1):
+            ngram = padded[offset : offset + n]
+            if ngram in vocabulary:
+                hits.append(ngram)
+        if last <= 0:
+            # Short word: its only n-gram is already counted once
+            break
+    return tuple(hits)
+
+
 class TimeClassifier:
     """Binary classifier: does text contain a time reference?"""
 
@@ -28,6 +59,10 @@ class TimeClassifier:
         self.vectorizer: TfidfVectorizer | None = None
         self.model: LogisticRegression | None = None
         self._is_trained = False
+        # Precomputed linear model for single-text inference (see _build_fast_path)
+        self._ngram_weights: dict[str, tuple[float, float]] | None = None
+        self._word_ngrams: Callable[[str], tuple[str, ...]] | None = None
+        self._bias = 0.0
 
     def train(self, texts: list[str], labels: list[int]) -> dict[str, float]:
         """Train classifier on labeled data.
@@ -65,6 +100,7 @@ class TimeClassifier:
         )
         self.model.fit(X, labels)
         self._is_trained = True
+        self._build_fast_path()
 
         # Compute metrics on training data (for info)
         predictions = self.model.predict(X)
@@ -88,8 +124,10 @@ class TimeClassifier:
         if not self._is_trained or self.vectorizer is None or self.model is None:
             raise RuntimeError("Classifier not trained. Call train() or load() first.")
 
-        X = self.vectorizer.transform([text])
-        return bool(self.model.predict(X)[0] == 1)
+        if self._ngram_weights is None:
+            X = self.vectorizer.transform([text])
+            return bool(self.model.predict(X)[0] == 1)
+        return self._decision(text) > 0
 
     def predict_proba(self, text: str) -> float:
         """Get probability of time reference.
@@ -103,10 +141,79 @@ class TimeClassifier:
         if not self._is_trained or self.vectorizer is None or self.model is None:
             raise RuntimeError("Classifier not trained. Call train() or load() first.")
 
-        X = self.vectorizer.transform([text])
-        proba = self.model.predict_proba(X)[0]
-        # Index 1 is probability of positive class
-        return float(proba[1])
+        if self._ngram_weights is None:
+            X = self.vectorizer.transform([text])
+            proba = self.model.predict_proba(X)[0]
+            # Index 1 is probability of positive class
+            return float(proba[1])
+
+        decision = self._decision(text)
+        if decision >= 0:
+            return 1.0 / (1.0 + math.exp(-decision))
+        exp = math.exp(decision)
+        return exp / (1.0 + exp)
+
+    def _build_fast_path(self) -> None:
+        """Flatten the fitted TF-IDF + logistic model into an n-gram weight table.
+
+        Single-text sklearn calls are dominated by validation and sparse
+        matrix setup, not math. Only the configuration trained here
+        (lowercased char_wb n-grams, l2-normalized TF-IDF, binary 0/1 labels)
+        is flattened; anything else keeps using sklearn.
+        """
+        self._ngram_weights = None
+        self._word_ngrams = None
+        vectorizer, model = self.vectorizer, self.model
+        if vectorizer is None or model is None:
+            return
+        params = vectorizer.get_params()
+        if (
+            params["analyzer"] != "char_wb"
+            or not params["lowercase"]
+            or params["preprocessor"] is not None
+            or params["strip_accents"] is not None
+            or params["binary"]
+            or not params["use_idf"]
+            or params["sublinear_tf"]
+            or params["norm"] != "l2"
+            or list(model.classes_) != [0, 1]
+        ):
+            return
+
+        coef = model.coef_[0]
+        idf = vectorizer.idf_
+        self._ngram_weights = {
+            ngram: (float(idf[index]), float(coef[index]))
+            for ngram, index in vectorizer.vocabulary_.items()
+        }
+        # Chat vocabulary repeats a lot, so memoize each word's n-gram hits
+        min_n, max_n = params["ngram_range"]
+        self._word_ngrams = lru_cache(maxsize=WORD_NGRAM_CACHE_SIZE)(
+            partial(_vocabulary_ngrams, vocabulary=self._ngram_weights, min_n=min_n, max_n=max_n)
+        )
+        self._bias = float(model.intercept_[0])  # type: ignore[index]
+
+    def _decision(self, text: str) -> float:
+        """Log-odds of a time reference, matching LogisticRegression.decision_function."""
+        weights, word_ngrams = self._ngram_weights, self._word_ngrams
+        if weights is None or word_ngrams is None:
+            raise RuntimeError("Fast path not built.")
+
+        counts: dict[str, int] = {}
+        for word in text.lower().split():
+            for ngram in word_ngrams(word):
+                counts[ngram] = counts.get(ngram, 0) + 1
+
+        dot = 0.0
+        norm_sq = 0.0
+        for ngram, count in counts.items():
+            idf, coef = weights[ngram]
+            tfidf = count * idf
+            dot += tfidf * coef
+            norm_sq += tfidf * tfidf
+        if norm_sq == 0.0:
+            return self._bias
+        return dot / math.sqrt(norm_sq) + self._bias
 
     def save(self, path: Path | None = None) -> None:
         """Save trained model to disk."""
@@ -131,6 +238,7 @@ class TimeClassifier:
             self.vectorizer = data["vectorizer"]
             self.model = data["model"]
             self._is_trained = True
+        self._build_fast_path()
 
     @property
     def is_trained(self) -> bool:
@@ -183,25 +291,67 @@ def train_from_corpus() -> dict[str, float]:
 
 # Global classifier instance (lazy loaded)
 _classifier: TimeClassifier | None = None
+# Guards the one-time load/train (prewarm thread vs. request path)
+_classifier_lock = threading.Lock()
 
 
 def get_classifier() -> TimeClassifier:
     """Get trained classifier (loads from disk if needed)."""
     global _classifier
 
-    if _classifier is None:
-        _classifier = TimeClassifier()
-        if MODEL_PATH.exists():
-            _classifier.load()
-        else:
-            # Train on first use if no saved model
-            texts, labels = load_training_data()
-            _classifier.train(texts, labels)
-            _classifier.save()
+    if _classifier is not None:
+        return _classifier
+
+    with _classifier_lock:
+        if _classifier is None:
+            classifier = TimeClassifier()
+            if MODEL_PATH.exists():
+                classifier.load()
+            else:
+                # Train on first use if no saved model
+                texts, labels = load_training_data()
+                classifier.train(texts, labels)
+                classifier.save()
+            # Publish only once ready, so other threads never see a half-loaded model
+            _classifier = classifier
 
     return _classifier
 
 
+async def get_classifier_async() -> TimeClassifier:
+    """Get trained classifier without blocking the event loop on a cold load.
+
+    A cold load (or waiting for the startup prewarm to finish) runs in a
+    worker thread; concurrent callers still share one load via the lock.
+    """
+    if _classifier is not None:
+        return _classifier
+    return await asyncio.to_thread(get_classifier)
+
+
+def _prewarm_classifier() -> None:
+    try:
+        get_classifier()
+    except Exception as e:
+        # Request-time callers handle a missing model or sklearn themselves
+        logger.debug(f"Classifier prewarm failed: {e}")
+
+
+def prewarm_classifier() -> threading.Thread:
+    """Load the time classifier in a background thread.
+
+    Called at startup so unpickling the model overlaps other initialization
+    instead of landing on the first message. Callers that need the classifier
+    before the thread finishes simply wait on its load lock.
+
+    Returns:
+        The started daemon thread.
+    """
+    thread = threading.Thread(target=_prewarm_classifier, name="classifier-prewarm", daemon=True)
+    thread.start()
+    return thread
+
+
 # Trigger pattern - any digit (covers 95%+ of time references)
 _TRIGGER = re.compile(r"\d")
 
@@ -6,6 +6,7 @@ LLM is only used as fallback when these rules fail.
 
 from __future__ import annotations
 
+import contextlib
 import re
 from functools import lru_cache
 from typing import TYPE_CHECKING
@@ -216,6 +217,21 @@ PATTERNS = {
 }
 
 
+# Word tokens for the timezone/city hint lookup in _find_nearest_tz_hint.
+# A maximal \w run equals a key exactly when the key's \b-bounded alternation
+# in PATTERNS["tz_hint"] / PATTERNS["city_hint"] would match there, so one
+# tokenizing pass plus dict lookups replaces scanning both alternations.
+_HINT_WORD_RE = re.compile(r"\w+")
+
+# Classifier-unavailable fallback for contains_time_reference, as one alternation
+_QUICK_TIME_RE = re.compile(
+    r"\d{1,2}:\d{2}"  # HH:MM
+    r"|\d{1,2}\s*(?:am|pm)"  # H am/pm
+    r"|\bat\s+\d{1,2}\b",  # at H
+    re.IGNORECASE,
+)
+
+
 def _find_nearest_tz_hint(text: str, position: int, max_distance: int = 20) -> str | None:
     """Find the nearest timezone hint to a given position in text.
 
@@ -230,24 +246,31 @@ def _find_nearest_tz_hint(text: str, position: int, max_distance: int = 20) -> s
     Returns:
         IANA timezone string if found, None otherwise.
     """
-    text_lower = text.lower()
-
     # Collect all timezone hints with their positions
     tz_hints: list[tuple[int, int, str]] = []  # (start, end, tz_iana)
-
-    # Check timezone abbreviations (Мск, PST, etc.)
-    for match in PATTERNS["tz_hint"].finditer(text):
-        abbrev = match.group(1).lower()
-        tz = TIMEZONE_ABBREVIATIONS.get(abbrev)
+    city_hints: list[tuple[int, int, str]] = []
+
+    # Check timezone abbreviations (Мск, PST, etc.) and city names in one pass;
+    # two-word cities ("new york") are looked up from adjacent words
+    prev: re.Match[str] | None = None
+    for match in _HINT_WORD_RE.finditer(text):
+        word = match.group().lower()
+        if prev is not None and match.start() == prev.end() + 1 and text[prev.end()] == " ":
+            tz = CITY_TIMEZONES.get(f"{prev.group().lower()} {word}")
+            if tz:
+                city_hints.append((prev.start(), match.end(), tz))
+                prev = None
+                continue
+        tz = TIMEZONE_ABBREVIATIONS.get(word)
         if tz:
             tz_hints.append((match.start(), match.end(), tz))
-
-    # Check city names
-    for match in PATTERNS["city_hint"].finditer(text_lower):
-        city = match.group(1).lower()
-        tz = CITY_TIMEZONES.get(city)
+        tz = CITY_TIMEZONES.get(word)
         if tz:
-            tz_hints.append((match.start(), match.end(), tz))
+            city_hints.append((match.start(), match.end(), tz))
+        prev = match
+
+    # Abbreviations before cities: ties in distance go to the first hint listed
+    tz_hints.extend(city_hints)
 
     # Check Russian "по {city}" pattern
     for match in PATTERNS["ru_po_city"].finditer(text):
@@ -291,6 +314,7 @@ async def parse_times(text: str) -> list[ParsedTime]:
         List of parsed time references.
     """
     # Early exit if ML classifier says no time reference
+    await _load_classifier_off_loop()
     if not contains_time_reference(text):
         return []
 
@@ -585,6 +609,15 @@ async def _try_llm_extraction(text: str, tz_hint: str | None) -> list[ParsedTime
         return []
 
 
+async def _load_classifier_off_loop() -> None:
+    """Load the ML classifier in a worker thread if it is not loaded yet."""
+    # contains_time_reference reports load failures and falls back on its own
+    with contextlib.suppress(Exception):
+        from src.core.time_classifier import get_classifier_async
+
+        await get_classifier_async()
+
+
 def contains_time_reference(text: str) -> bool:
     """Check if text likely contains a time reference.
 
@@ -615,14 +648,8 @@ def contains_time_reference(text: str) -> bool:
 
         logging.getLogger(__name__).warning(f"ML classifier error: {e}")
 
-    # Fallback to simple regex patterns
-    quick_patterns = [
-        r"\d{1,2}:\d{2}",  # HH:MM
-        r"\d{1,2}\s*(am|pm)",  # H am/pm
-        r"\bat\s+\d{1,2}\b",  # at H
-    ]
-    text_lower = text.lower()
-    return any(re.search(p, text_lower, re.IGNORECASE) for p in quick_patterns)
+    # Fallback to simple regex patterns (single pass)
+    return _QUICK_TIME_RE.search(text) is not None
 
 
 def get_highest_confidence_time(times: Sequence[ParsedTime]) -> ParsedTime | None:
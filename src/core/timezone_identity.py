@@ -36,7 +36,7 @@ def get_effective_confidence(state: UserTzState, config: ConfidenceConfig) -> fl
 
     # Calculate days since last update
     now = datetime.now(UTC)
-    # Handle naive datetime from state (utcnow() returns naive)
+    # Handle naive datetime from state (MongoDB returns naive UTC values)
     updated_at = state.updated_at
     if updated_at.tzinfo is None:
         updated_at = updated_at.replace(tzinfo=UTC)
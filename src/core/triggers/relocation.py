@@ -136,6 +136,39 @@ RELOCATION_PATTERNS: list[tuple[re.Pattern[str], str]] = [
     ),
 ]
 
+# Lowercase literal that every match of the named pattern must contain.
+# Checked with a plain substring test before the (much slower) regex search,
+# so ordinary chat messages skip almost all of the patterns above.
+PATTERN_KEYWORDS: dict[str, str] = {
+    "moved_to": "move",
+    "relocated_to": "relocate",
+    "arrived_in": "arrive",
+    "now_in": "now",
+    "moving_to": "moving",
+    "relocated_ru": "переехал",
+    "relocated_ru_2": "перееха",
+    "arrived_ru": "приехал",
+    "now_in_ru": "теперь",
+    "moving_ru": "перееду",
+    "moving_ru_2": "переезжаю",
+    "next_week_in_ru": "недел",
+    "will_be_in_ru": "буду",
+    "going_to_ru": "еду",
+    "flying_to_ru": "лечу",
+    "leaving_for_ru": "уезжаю",
+    "flying_off_ru": "улетаю",
+    "business_trip_ru": "командировк",
+    "working_from_ru": "работаю",
+    "next_week_in_en": "week",
+    "will_be_in_en": "be",
+    "going_to_en": "going",
+    "flying_to_en": "flying",
+    "traveling_to_en": "traveling",
+    "visiting_en": "visiting",
+    "staying_in_en": "staying",
+    "working_from_en": "working",
+}
+
 
 class RelocationDetector:
     """Detects relocation intent in messages.
@@ -163,7 +196,10 @@ class RelocationDetector:
         settings = get_settings()
 
         # Strategy 1: Regex patterns for explicit relocation phrases (high confidence)
+        lowered = text.lower()
         for pattern, pattern_name in RELOCATION_PATTERNS:
+            if PATTERN_KEYWORDS[pattern_name] not in lowered:
+                continue
             match = pattern.search(text)
             if match:
                 city = _clean_city(match.group(1).strip())
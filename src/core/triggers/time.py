@@ -75,7 +75,7 @@ class TimeDetector:
                 if geocoded_tz:
                     source_tz = geocoded_tz
                     is_explicit_tz = True
-                    logger.debug(f"Geocoded TZ from text: {geocoded_tz}")
+                    logger.debug("Geocoded TZ from text: %s", geocoded_tz)
 
             # If still no explicit TZ, fall back to user's timezone
             if source_tz is None:
@@ -124,7 +124,7 @@ class TimeDetector:
         # Use unified geocoding (handles Russian case normalization internally)
         result = geocode_city(city, use_llm=False)  # No LLM in detection path
         if result:
-            logger.debug(f"Geocoded '{city}' → {result[0]} ({result[1]})")
+            logger.debug("Geocoded '%s' → %s (%s)", city, result[0], result[1])
             return result[1]
 
         return None
@@ -6,6 +6,7 @@ Loads configuration from environment variables (.env) and configuration.yaml.
 from __future__ import annotations
 
 import os
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
@@ -32,6 +33,14 @@ class TimezoneConfig(BaseModel):
     team_timezones: list[str] = Field(default_factory=list)
     team_cities: list[CityConfig] = Field(default_factory=list)
 
+    @cached_property
+    def team_city_by_name(self) -> dict[str, CityConfig]:
+        """Team cities keyed by lowercased name (first entry wins on duplicates)."""
+        by_name: dict[str, CityConfig] = {}
+        for city in self.team_cities:
+            by_name.setdefault(city.name.lower(), city)
+        return by_name
+
 
 class ConfidenceConfig(BaseModel):
     """Confidence threshold configuration.
@@ -81,6 +90,8 @@ class DedupeConfig(BaseModel):
     cache_cleanup_multiplier: int = (
         10  # Retention cutoff: entries older than throttle_seconds * multiplier are removed
     )
+    write_batch_size: int = 100  # Max dedupe records per insert_many
+    write_linger_seconds: float = 0.01  # Wait for more records before writing a batch
 
 
 class RateLimitConfig(BaseModel):
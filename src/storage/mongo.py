@@ -10,8 +10,8 @@ from datetime import UTC, datetime
 from typing import Any
 
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
-from pymongo import ASCENDING
-from pymongo.errors import DuplicateKeyError
+from pymongo import ASCENDING, ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
 from src.core.models import (
     ChatState,
@@ -25,6 +25,9 @@ from src.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# MongoDB server error code for a unique index violation
+DUPLICATE_KEY_ERROR = 11000
+
 
 class MongoStorage:
     """MongoDB storage operations."""
@@ -254,8 +257,9 @@ class MongoStorage:
         """
         now = datetime.now(UTC)
 
-        # First, ensure the chat document exists and set the user's timezone
-        await self.db.chats.update_one(
+        # Ensure the chat document exists, set the user's timezone and read back
+        # the post-update user_timezones in the same round trip
+        doc = await self.db.chats.find_one_and_update(
             {"platform": platform.value, "chat_id": chat_id},
             {
                 "$set": {
@@ -269,11 +273,12 @@ class MongoStorage:
                     "created_at": now,
                 },
             },
+            projection={"user_timezones": True},
             upsert=True,
+            return_document=ReturnDocument.AFTER,
         )
 
-        # Read back and recompute active_timezones from user_timezones values
-        doc = await self.db.chats.find_one({"platform": platform.value, "chat_id": chat_id})
+        # Recompute active_timezones from user_timezones values
         if doc:
             user_timezones: dict[str, str] = doc.get("user_timezones", {})
             active_timezones = sorted(set(user_timezones.values()))
@@ -294,17 +299,18 @@ class MongoStorage:
             chat_id: Chat identifier.
             tz_iana: IANA timezone to add.
         """
+        now = datetime.now(UTC)
         await self.db.chats.update_one(
             {"platform": platform.value, "chat_id": chat_id},
             {
                 "$addToSet": {"active_timezones": tz_iana},
-                "$set": {"updated_at": datetime.now(UTC)},
+                "$set": {"updated_at": now},
                 "$setOnInsert": {
                     "platform": platform.value,
                     "chat_id": chat_id,
                     "default_tz": None,
                     "user_timezones": {},
-                    "created_at": datetime.now(UTC),
+                    "created_at": now,
                 },
             },
             upsert=True,
@@ -334,8 +340,10 @@ class MongoStorage:
         Returns:
             True if event exists (was processed).
         """
+        # Existence check only - project _id so the index lookup returns no payload
         doc = await self.db.dedupe_events.find_one(
-            {"platform": platform.value, "event_id": event_id}
+            {"platform": platform.value, "event_id": event_id},
+            projection={"_id": True},
         )
         return doc is not None
 
@@ -361,6 +369,35 @@ class MongoStorage:
         except DuplicateKeyError:
             return False
 
+    async def insert_dedupe_events(self, events: list[DedupeEvent]) -> int:
+        """Insert several dedupe event records in one unordered bulk write.
+
+        Args:
+            events: DedupeEvents to insert.
+
+        Returns:
+            Number of records inserted (duplicates are skipped).
+        """
+        try:
+            result = await self.db.dedupe_events.insert_many(
+                [
+                    {
+                        "platform": event.platform.value,
+                        "event_id": event.event_id,
+                        "chat_id": event.chat_id,
+                        "created_at": event.created_at,
+                    }
+                    for event in events
+                ],
+                ordered=False,
+            )
+            return len(result.inserted_ids)
+        except BulkWriteError as e:
+            # Duplicate keys only; every other record was still written
+            if any(error.get("code") != DUPLICATE_KEY_ERROR for error in e.details["writeErrors"]):
+                raise
+            return e.details["nInserted"]
+
     # Session operations (agent mode)
 
     async def get_active_session(
@@ -38,6 +38,14 @@ def disable_llm_extraction(request: pytest.FixtureRequest) -> Generator[None, No
         yield
 
 
+@pytest.fixture(autouse=True, scope="session")
+def isolated_cache_home(tmp_path_factory: pytest.TempPathFactory) -> Generator[None, None, None]:
+    """Point XDG_CACHE_HOME at a temp dir so tests never touch ~/.cache."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
+        yield
+
+
 # Register custom markers (integration marker is in pyproject.toml)
 def pytest_configure(config: pytest.Config) -> None:
     """Register custom markers."""
@@ -0,0 +1,93 @@
+"""Tests for the LangChain agent session handler."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from langchain_core.messages import ToolMessage
+
+from src.core.agent_handler import AgentHandler
+from src.core.models import NormalizedEvent, Platform, Session, SessionGoal, SessionStatus
+from src.settings import get_settings
+from src.storage.mongo import MongoStorage
+
+
+def make_geo_session() -> Session:
+    """Create an active CLARIFY_GEO_INTENT session for Berlin."""
+    return Session(
+        session_id="sess_geo",
+        platform=Platform.TELEGRAM,
+        chat_id="chat_1",
+        user_id="user_1",
+        goal=SessionGoal.CLARIFY_GEO_INTENT,
+        expires_at=datetime.now(UTC) + timedelta(minutes=30),
+        context={"city": "Berlin", "timezone": "Europe/Berlin", "history": []},
+    )
+
+
+class TestGeoIntentAgent:
+    """Tests for the geo intent clarification agent."""
+
+    async def test_geo_agent_is_compiled_once(self) -> None:
+        """The geo intent agent graph is built at init, not per message."""
+        storage = MagicMock(spec=MongoStorage)
+        storage.close_session = AsyncMock()
+        geo_agent = MagicMock()
+        geo_agent.ainvoke = AsyncMock(
+            return_value={"messages": [ToolMessage(content="NO_ACTION", tool_call_id="call_1")]}
+        )
+
+        with (
+            patch("src.core.agent_handler.ChatOpenAI"),
+            patch(
+                "src.core.agent_handler.create_react_agent",
+                side_effect=[MagicMock(), geo_agent],
+            ) as mock_create,
+        ):
+            handler = AgentHandler(storage, get_settings())
+            event = NormalizedEvent(
+                platform=Platform.TELEGRAM,
+                event_id="evt_1",
+                chat_id="chat_1",
+                user_id="user_1",
+                text="I was in Berlin last year",
+            )
+            for _ in range(2):
+                result = await handler.handle(make_geo_session(), event)
+                assert not result.should_respond
+
+        assert mock_create.call_count == 2
+        assert geo_agent.ainvoke.await_count == 2
+        storage.close_session.assert_awaited_with("sess_geo", SessionStatus.COMPLETED)
+
+
+class TestTimeoutFallbackGeocode:
+    """Tests for recovering a timezone from user text after an agent timeout."""
+
+    def test_uses_geocoded_timezone(self) -> None:
+        """The timezone comes straight from the geocoder's (city, tz) result."""
+        with (
+            patch("src.core.agent_handler.ChatOpenAI"),
+            patch("src.core.agent_handler.create_react_agent"),
+        ):
+            handler = AgentHandler(MagicMock(spec=MongoStorage), get_settings())
+
+        with patch(
+            "src.core.geo.geocode_city", return_value=("Tokyo", "Asia/Tokyo")
+        ) as mock_geocode:
+            tz = handler._extract_timezone_from_partial_messages("Tokyo")
+
+        assert tz == "Asia/Tokyo"
+        mock_geocode.assert_called_once_with("Tokyo", use_llm=False)
+
+    def test_returns_none_when_nothing_found(self) -> None:
+        """No candidate geocodes, so no timezone is recovered."""
+        with (
+            patch("src.core.agent_handler.ChatOpenAI"),
+            patch("src.core.agent_handler.create_react_agent"),
+        ):
+            handler = AgentHandler(MagicMock(spec=MongoStorage), get_settings())
+
+        with patch("src.core.geo.geocode_city", return_value=None):
+            assert handler._extract_timezone_from_partial_messages("Atlantis") is None
@@ -7,6 +7,7 @@ from unittest.mock import patch
 import pytest
 
 from src.core.agent_tools import (
+    convert_time,
     geocode_city,
     lookup_configured_city,
     lookup_tz_abbreviation,
@@ -165,6 +166,11 @@ class TestLookupConfiguredCity:
         assert "FOUND:" in result
         assert "Europe/London" in result
 
+    def test_configured_city_case_and_whitespace_insensitive(self) -> None:
+        """Test that lookup ignores case and surrounding whitespace."""
+        result = lookup_configured_city.invoke({"city_name": "  new YORK "})
+        assert result == "FOUND: New York → America/New_York"
+
     def test_configured_city_not_found(self) -> None:
         """Test that non-configured cities return NOT_FOUND."""
         result = lookup_configured_city.invoke({"city_name": "Paris"})
@@ -212,6 +218,9 @@ class TestSaveTimezone:
             "Europe/London",
             "Asia/Tokyo",
             "UTC",
+            "America/Argentina/Buenos_Aires",
+            "America/Port-au-Prince",
+            "Etc/GMT+3",
         ],
     )
     def test_valid_timezone(self, valid_tz: str) -> None:
@@ -226,6 +235,9 @@ class TestSaveTimezone:
             "EST",  # Abbreviation, not IANA
             "Berlin",  # City name, not IANA
             "random",  # Random string
+            "foo/bar baz",  # Slash present but not an identifier
+            "Europe/",  # Missing city part
+            "Europe/Berlin\n",  # Trailing newline
         ],
     )
     def test_invalid_timezone(self, invalid_tz: str) -> None:
@@ -234,6 +246,38 @@ class TestSaveTimezone:
         assert "ERROR:" in result
 
 
+class TestConvertTime:
+    """Tests for convert_time tool."""
+
+    def test_converts_between_zones(self) -> None:
+        """Test conversion between two fixed-offset zones."""
+        result = convert_time.invoke(
+            {"time_str": "15:00", "source_tz": "Asia/Tokyo", "target_tz": "Asia/Kolkata"}
+        )
+        assert result == "CONVERT: 15:00 Asia/Tokyo → 11:30 Asia/Kolkata"
+
+    def test_pm_suffix(self) -> None:
+        """Test that pm suffix shifts the hour."""
+        result = convert_time.invoke(
+            {"time_str": "3:30pm", "source_tz": "UTC", "target_tz": "Asia/Tokyo"}
+        )
+        assert result == "CONVERT: 15:30 UTC → 00:30 Asia/Tokyo"
+
+    def test_uppercase_pm_suffix(self) -> None:
+        """Test that uppercase PM suffix is stripped before parsing minutes."""
+        result = convert_time.invoke(
+            {"time_str": "3:30 PM", "source_tz": "UTC", "target_tz": "UTC"}
+        )
+        assert result == "CONVERT: 15:30 UTC → 15:30 UTC"
+
+    def test_invalid_timezone(self) -> None:
+        """Test unknown timezone returns ERROR."""
+        result = convert_time.invoke(
+            {"time_str": "15:00", "source_tz": "Mars/Olympus", "target_tz": "UTC"}
+        )
+        assert result.startswith("ERROR:")
+
+
 class TestEdgeCases:
     """Edge case tests for agent tools."""
 
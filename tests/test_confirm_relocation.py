@@ -0,0 +1,203 @@
+"""Tests for the rules-based confirm relocation session handler."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.handlers import confirm_relocation
+from src.core.handlers.confirm_relocation import ConfirmRelocationHandler
+from src.core.models import (
+    NormalizedEvent,
+    Platform,
+    Session,
+    SessionGoal,
+    SessionStatus,
+)
+from src.core.session_utils import MAX_SESSION_ATTEMPTS
+from src.storage.mongo import MongoStorage
+
+
+def make_session() -> Session:
+    """Create an active CONFIRM_RELOCATION session for Berlin."""
+    return Session(
+        session_id="sess_1",
+        platform=Platform.TELEGRAM,
+        chat_id="chat_1",
+        user_id="user_1",
+        goal=SessionGoal.CONFIRM_RELOCATION,
+        expires_at=datetime.now(UTC) + timedelta(minutes=30),
+        context={
+            "attempts": 0,
+            "history": [],
+            "resolved_city": "Berlin",
+            "resolved_tz": "Europe/Berlin",
+        },
+    )
+
+
+def make_event(text: str) -> NormalizedEvent:
+    """Create a user reply event."""
+    return NormalizedEvent(
+        platform=Platform.TELEGRAM,
+        event_id="evt_1",
+        chat_id="chat_1",
+        user_id="user_1",
+        text=text,
+    )
+
+
+class TestConfirmRelocationHandler:
+    """Tests for ConfirmRelocationHandler.handle."""
+
+    @pytest.fixture
+    def storage(self) -> MagicMock:
+        """Create a mock storage instance."""
+        storage = MagicMock(spec=MongoStorage)
+        storage.upsert_user_tz_state = AsyncMock()
+        storage.close_session = AsyncMock()
+        storage.update_session = AsyncMock()
+        return storage
+
+    @pytest.mark.parametrize("reply", ["да", " Yes ", "OK", "+", "да, всё так"])
+    async def test_confirmation_saves_timezone(self, storage: MagicMock, reply: str) -> None:
+        """Confirm words and "да..." replies should save the resolved timezone."""
+        handler = ConfirmRelocationHandler(storage)
+
+        result = await handler.handle(make_session(), make_event(reply))
+
+        assert result.should_respond
+        saved_state = storage.upsert_user_tz_state.call_args.args[0]
+        assert saved_state.tz_iana == "Europe/Berlin"
+        storage.close_session.assert_awaited_once_with("sess_1", SessionStatus.COMPLETED)
+
+    @pytest.mark.parametrize("reply", ["нет", "No", "nope"])
+    async def test_rejection_asks_for_city(self, storage: MagicMock, reply: str) -> None:
+        """Reject words should keep the session open and ask for a city."""
+        handler = ConfirmRelocationHandler(storage)
+
+        result = await handler.handle(make_session(), make_event(reply))
+
+        assert result.should_respond
+        storage.upsert_user_tz_state.assert_not_called()
+        storage.update_session.assert_awaited_once()
+
+    async def test_city_reply_geocodes_and_asks_to_confirm(self, storage: MagicMock) -> None:
+        """A city reply should update the session with the new resolved timezone."""
+        handler = ConfirmRelocationHandler(storage)
+        session = make_session()
+
+        with patch(
+            "src.core.handlers.confirm_relocation.geocode_city",
+            return_value=("Tokyo", "Asia/Tokyo"),
+        ):
+            result = await handler.handle(session, make_event("Tokyo"))
+
+        assert result.should_respond
+        assert session.context["resolved_tz"] == "Asia/Tokyo"
+        storage.update_session.assert_awaited_once()
+
+    async def test_exclaimed_city_reply_is_geocoded(self, storage: MagicMock) -> None:
+        """Trailing punctuation is dropped before the reply is geocoded."""
+        handler = ConfirmRelocationHandler(storage)
+        session = make_session()
+        confirm_relocation._geocode_cache.clear()
+
+        with patch(
+            "src.core.handlers.confirm_relocation.geocode_city",
+            return_value=("Tokyo", "Asia/Tokyo"),
+        ) as mock_geocode:
+            result = await handler.handle(session, make_event("Tokyo!"))
+
+        assert result.should_respond
+        mock_geocode.assert_called_once_with("Tokyo", use_llm=True)
+        assert session.context["resolved_tz"] == "Asia/Tokyo"
+
+    async def test_city_reply_at_attempt_limit_fails_without_update(
+        self, storage: MagicMock
+    ) -> None:
+        """The last allowed attempt closes the session instead of writing it first."""
+        handler = ConfirmRelocationHandler(storage)
+        session = make_session()
+        session.context["attempts"] = MAX_SESSION_ATTEMPTS - 1
+
+        with patch(
+            "src.core.handlers.confirm_relocation.geocode_city",
+            return_value=("Tokyo", "Asia/Tokyo"),
+        ):
+            result = await handler.handle(session, make_event("Tokyo"))
+
+        assert result.should_respond
+        storage.update_session.assert_not_called()
+        storage.close_session.assert_awaited_once_with("sess_1", SessionStatus.FAILED)
+
+    @pytest.mark.parametrize(
+        "reply",
+        [
+            "I am not sure what you mean here, can you explain?",
+            "подожди: я уточню",
+            "this is definitely not a city name",
+        ],
+    )
+    async def test_sentence_reply_skips_geocoding(self, storage: MagicMock, reply: str) -> None:
+        """Sentence-like replies ask again without calling the geocoder."""
+        handler = ConfirmRelocationHandler(storage)
+        session = make_session()
+
+        with patch("src.core.handlers.confirm_relocation.geocode_city") as mock_geocode:
+            result = await handler.handle(session, make_event(reply))
+
+        assert result.should_respond
+        mock_geocode.assert_not_called()
+        assert session.context["attempts"] == 1
+        assert session.context["resolved_tz"] == "Europe/Berlin"
+
+    @pytest.mark.parametrize(
+        "reply",
+        ["St. Petersburg", "Berlin, Germany", "Rio de Janeiro", "Berlin!", "Москва!", "Tokyo?"],
+    )
+    def test_city_like_replies(self, reply: str) -> None:
+        """Dots, commas and trailing punctuation still count as city names."""
+        assert confirm_relocation._looks_like_city(reply)
+
+
+class TestGeocodeReplyCache:
+    """Tests for the in-process cache of city reply geocodes."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self) -> None:
+        confirm_relocation._geocode_cache.clear()
+
+    def test_normalized_repeats_hit_cache(self) -> None:
+        """Case, punctuation and spacing variants share one geocode call."""
+        with patch(
+            "src.core.handlers.confirm_relocation.geocode_city",
+            return_value=("Moscow", "Europe/Moscow"),
+        ) as mock_geocode:
+            for reply in ("Москва", "москва!", "  МОСКВА  "):
+                assert confirm_relocation._geocode_reply(reply) == ("Moscow", "Europe/Moscow")
+        mock_geocode.assert_called_once()
+
+    def test_misses_are_not_cached(self) -> None:
+        """NOT_FOUND results may be transient and are retried."""
+        with patch(
+            "src.core.handlers.confirm_relocation.geocode_city",
+            return_value=None,
+        ) as mock_geocode:
+            confirm_relocation._geocode_reply("Atlantis")
+            confirm_relocation._geocode_reply("Atlantis")
+        assert mock_geocode.call_count == 2
+
+    def test_cache_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Least recently used entries are evicted past the size limit."""
+        monkeypatch.setattr(confirm_relocation, "GEOCODE_CACHE_SIZE", 2)
+
+        def fake_geocode(text: str, use_llm: bool = True) -> tuple[str, str]:
+            return (text, "UTC")
+
+        with patch("src.core.handlers.confirm_relocation.geocode_city", side_effect=fake_geocode):
+            for reply in ("a1", "b2", "a1", "c3"):
+                confirm_relocation._geocode_reply(reply)
+        assert list(confirm_relocation._geocode_cache) == ["a1", "c3"]
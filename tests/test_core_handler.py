@@ -6,6 +6,8 @@ test_protocols.py and test_pipeline_e2e.py.
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 
 from src.core.time_convert import (
@@ -106,6 +108,24 @@ class TestContainsTimeReference:
         assert contains_time_reference("The weather is nice today") is False
         assert contains_time_reference("Schedule a meeting") is False  # no digits!
 
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("Meet at 14:30", True),
+            ("Call at 3 PM", True),
+            ("AT 10 works", True),
+            ("Room 42 is free", False),
+            ("The weather is nice today", False),
+        ],
+    )
+    def test_regex_fallback_without_classifier(self, text: str, expected: bool) -> None:
+        """Test the regex fallback used when the ML classifier is unavailable."""
+        with patch(
+            "src.core.time_classifier.contains_time_ml",
+            side_effect=RuntimeError("not trained"),
+        ):
+            assert contains_time_reference(text) is expected
+
     @pytest.mark.xfail(reason="Not implemented: word-based times (midnight/noon)", strict=True)
     def test_detects_midnight_noon(self) -> None:
         """Test detection of time words without digits."""
@@ -64,18 +64,61 @@ class TestMarkProcessed:
     async def test_creates_dedupe_event(self) -> None:
         """Should create DedupeEvent and insert into storage."""
         mock_storage = MagicMock()
-        mock_storage.insert_dedupe_event = AsyncMock()
+        mock_storage.insert_dedupe_events = AsyncMock(return_value=1)
         manager = DedupeManager(mock_storage)
 
         await manager.mark_processed(Platform.TELEGRAM, "event123", "chat456")
+        await manager.flush()
 
-        mock_storage.insert_dedupe_event.assert_called_once()
-        event = mock_storage.insert_dedupe_event.call_args[0][0]
+        mock_storage.insert_dedupe_events.assert_called_once()
+        [event] = mock_storage.insert_dedupe_events.call_args[0][0]
         assert event.platform == Platform.TELEGRAM
         assert event.event_id == "event123"
         assert event.chat_id == "chat456"
         assert event.created_at is not None
 
+    @pytest.mark.asyncio
+    async def test_concurrent_events_share_one_write(self) -> None:
+        """Events marked close together are written with a single insert_many."""
+        mock_storage = MagicMock()
+        mock_storage.insert_dedupe_events = AsyncMock(return_value=3)
+        manager = DedupeManager(mock_storage)
+
+        for event_id in ("e1", "e2", "e3"):
+            await manager.mark_processed(Platform.SLACK, event_id, "chat")
+        await manager.flush()
+
+        mock_storage.insert_dedupe_events.assert_called_once()
+        events = mock_storage.insert_dedupe_events.call_args[0][0]
+        assert [e.event_id for e in events] == ["e1", "e2", "e3"]
+
+    @pytest.mark.asyncio
+    async def test_unwritten_event_is_already_duplicate(self) -> None:
+        """A processed event counts as duplicate before its record is written."""
+        mock_storage = MagicMock()
+        mock_storage.check_dedupe_event = AsyncMock(return_value=False)
+        mock_storage.insert_dedupe_events = AsyncMock(return_value=1)
+        manager = DedupeManager(mock_storage)
+
+        await manager.mark_processed(Platform.TELEGRAM, "event123", "chat456")
+
+        assert await manager.is_duplicate(Platform.TELEGRAM, "event123") is True
+        mock_storage.check_dedupe_event.assert_not_called()
+        await manager.flush()
+
+    @pytest.mark.asyncio
+    async def test_failed_write_does_not_block_flush(self) -> None:
+        """A storage error is logged and the pending records are released."""
+        mock_storage = MagicMock()
+        mock_storage.check_dedupe_event = AsyncMock(return_value=False)
+        mock_storage.insert_dedupe_events = AsyncMock(side_effect=RuntimeError("down"))
+        manager = DedupeManager(mock_storage)
+
+        await manager.mark_processed(Platform.TELEGRAM, "event123", "chat456")
+        await manager.flush()
+
+        assert await manager.is_duplicate(Platform.TELEGRAM, "event123") is False
+
 
 class TestIsThrottled:
     """Tests for is_throttled method."""
@@ -223,3 +266,43 @@ class TestPeriodicCleanup:
             manager.record_response(Platform.TELEGRAM, f"chat{config.cache_cleanup_multiplier}")
 
             mock_cleanup.assert_called_once()
+
+
+class TestDedupeStorageIndexes:
+    """Tests for dedupe_events index setup in MongoStorage."""
+
+    @pytest.mark.asyncio
+    async def test_created_at_ttl_index_uses_configured_retention(self) -> None:
+        """Dedupe events should expire via a TTL index, so no sweep is needed."""
+        from src.storage.mongo import MongoStorage
+
+        storage = MongoStorage()
+        db = MagicMock()
+        for collection in (db.users, db.chats, db.dedupe_events, db.sessions):
+            collection.create_index = AsyncMock()
+        storage._db = db
+
+        await storage._ensure_indexes()
+
+        ttl_seconds = storage.settings.config.dedupe.ttl_seconds
+        db.dedupe_events.create_index.assert_any_call(
+            [("created_at", 1)],
+            expireAfterSeconds=ttl_seconds,
+            name="created_at_ttl",
+        )
+
+    @pytest.mark.asyncio
+    async def test_check_dedupe_event_projects_id_only(self) -> None:
+        """Existence check should not fetch the full dedupe document."""
+        from src.storage.mongo import MongoStorage
+
+        storage = MongoStorage()
+        db = MagicMock()
+        db.dedupe_events.find_one = AsyncMock(return_value={"_id": "x"})
+        storage._db = db
+
+        assert await storage.check_dedupe_event(Platform.TELEGRAM, "event123") is True
+        db.dedupe_events.find_one.assert_called_once_with(
+            {"platform": "telegram", "event_id": "event123"},
+            projection={"_id": True},
+        )
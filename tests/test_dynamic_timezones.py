@@ -6,6 +6,7 @@ Time conversion should use merged list: config timezones + chat's detected timez
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -37,6 +38,27 @@ class TestChatActiveTimezones:
             Platform.TELEGRAM, "chat_123", "Europe/Moscow"
         )
 
+    async def test_update_user_timezone_reads_back_in_single_round_trip(self) -> None:
+        """Storage should upsert and read back user_timezones without a separate find."""
+        storage = MongoStorage()
+        db = MagicMock()
+        db.chats.find_one_and_update = AsyncMock(
+            return_value={"user_timezones": {"u1": "Europe/Moscow", "u2": "Asia/Tokyo"}}
+        )
+        db.chats.find_one = AsyncMock()
+        db.chats.update_one = AsyncMock()
+        storage._db = db
+
+        await storage.update_user_timezone_in_chat(
+            Platform.TELEGRAM, "chat_123", "u1", "Europe/Moscow"
+        )
+
+        db.chats.find_one.assert_not_called()
+        db.chats.update_one.assert_called_once_with(
+            {"platform": "telegram", "chat_id": "chat_123"},
+            {"$set": {"active_timezones": ["Asia/Tokyo", "Europe/Moscow"]}},
+        )
+
 
 class TestMergeTimezones:
     """Tests for merging config and chat timezones."""
@@ -124,6 +146,67 @@ class TestPipelineContextResolution:
         assert "Europe/Moscow" in context.target_timezones
         assert "Asia/Tokyo" in context.target_timezones
 
+    async def test_resolve_context_reads_user_and_chat_state_concurrently(
+        self, mock_storage: MongoStorage
+    ) -> None:
+        """User timezone and chat timezones should be fetched in parallel."""
+        from src.core.models import ChatState, NormalizedEvent, StateResult
+        from src.core.pipeline import Pipeline
+
+        chat_read_started = asyncio.Event()
+
+        async def get_chat_state(*_args: object) -> ChatState:
+            chat_read_started.set()
+            return ChatState(
+                platform=Platform.TELEGRAM, chat_id="chat_123", active_timezones=["Asia/Tokyo"]
+            )
+
+        async def get_state(**_kwargs: object) -> StateResult[str]:
+            # Only completes if the chat read is already in flight
+            await asyncio.wait_for(chat_read_started.wait(), timeout=1.0)
+            return StateResult[str](value="Europe/Berlin", confidence=1.0, source="verified")
+
+        mock_storage.get_chat_state = AsyncMock(side_effect=get_chat_state)
+        tz_manager = MagicMock()
+        tz_manager.get_state = AsyncMock(side_effect=get_state)
+        pipeline = Pipeline(state_managers={"timezone": tz_manager}, storage=mock_storage)
+
+        event = NormalizedEvent(
+            platform=Platform.TELEGRAM,
+            event_id="evt_001",
+            chat_id="chat_123",
+            user_id="user_456",
+            text="3 pm",
+            message_id="msg_789",
+        )
+
+        context = await pipeline._resolve_context(event, [])
+
+        assert context.source_timezone == "Europe/Berlin"
+        assert "Asia/Tokyo" in context.target_timezones
+
+    async def test_resolve_context_reuses_bound_team_timezones(self) -> None:
+        """Team timezones are read from settings once, not per event."""
+        from src.core.models import NormalizedEvent
+        from src.core.pipeline import Pipeline
+
+        pipeline = Pipeline(storage=None)
+        event = NormalizedEvent(
+            platform=Platform.TELEGRAM,
+            event_id="evt_001",
+            chat_id="chat_123",
+            user_id="user_456",
+            text="3 pm",
+        )
+
+        pipeline._team_timezones = ["Asia/Tokyo"]
+        pipeline._team_timezone_set = frozenset(pipeline._team_timezones)
+
+        context = await pipeline._resolve_context(event, [])
+
+        assert context.team_timezones == frozenset({"Asia/Tokyo"})
+        assert context.target_timezones == ["Asia/Tokyo"]
+
     async def test_resolve_context_works_without_storage(self) -> None:
         """Pipeline should work with just config timezones when no storage."""
         from src.core.models import NormalizedEvent
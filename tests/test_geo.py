@@ -1,10 +1,25 @@
 """Tests for the unified geocoding module."""
 
+import os
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
 import pytest
 
+from src.core import geo
 from src.core.geo import (
+    _ask_llm_city_name,
+    _geonames_index_cache_path,
+    _get_geonames_indexes,
+    _load_geonames_indexes,
     _lookup_geonames,
+    _lookup_geonames_cached,
     _normalize_russian_case,
+    _normalize_with_llm,
+    _save_geonames_indexes,
+    find_cities_in_text,
     geocode_city,
     geocode_city_str,
 )
@@ -23,6 +38,9 @@ class TestNormalizeRussianCase:
             # Dative -ве → -ва
             ("Москве", "Москва"),
             ("москве", "москва"),
+            ("МОСКВЕ", "МОСКВА"),
+            # Accusative -ву → -ва
+            ("Москву", "Москва"),
             # Dative -ни → -нь
             ("Казани", "Казань"),
             # Dative -ну → -н
@@ -32,6 +50,10 @@ class TestNormalizeRussianCase:
             ("Вене", "Вена"),
             # Prepositional -те → -т
             ("Ташкенте", "Ташкент"),
+            # Prepositional -ине → -ин (wins over -не)
+            ("Берлине", "Берлин"),
+            # Generic prepositional ending after a consonant
+            ("Бишкеке", "Бишкек"),
             # No change needed
             ("Москва", "Москва"),
             ("London", "London"),
@@ -42,6 +64,13 @@ class TestNormalizeRussianCase:
         """Test Russian case normalization."""
         assert _normalize_russian_case(input_city) == expected
 
+    def test_results_are_memoized(self) -> None:
+        """Recurring tokens should be served from the cache."""
+        _normalize_russian_case.cache_clear()
+        _normalize_russian_case("Москве")
+        _normalize_russian_case("Москве")
+        assert _normalize_russian_case.cache_info().hits == 1
+
 
 class TestLookupGeonames:
     """Tests for direct geonames lookup."""
@@ -89,6 +118,184 @@ class TestLookupGeonames:
         assert _lookup_geonames("") is None
         assert _lookup_geonames("A") is None
 
+    def test_lookups_reuse_prebuilt_indexes(self) -> None:
+        """Lookups should probe the hash indexes, not rescan geonames."""
+        _get_geonames_indexes()
+        with patch("src.core.geo._get_geonames_cache") as mock_cache:
+            assert _lookup_geonames("Tokyo") == ("Tokyo", "Asia/Tokyo")
+            assert _lookup_geonames("NotARealCityXYZ123") is None
+        mock_cache.assert_not_called()
+
+    def test_name_match_beats_more_populous_altname(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Both tables are indexed in one pass; a primary name still wins over altnames."""
+        cities = {
+            "1": {"name": "Springfield", "timezone": "America/Chicago", "population": 100},
+            "2": {
+                "name": "Capital City",
+                "timezone": "America/New_York",
+                "population": 10_000,
+                "alternatenames": ["Springfield", "Cap"],
+            },
+        }
+        fake_cache = MagicMock()
+        fake_cache.get_cities.return_value = cities
+        monkeypatch.setattr(geo, "_get_geonames_cache", lambda: fake_cache)
+        monkeypatch.setattr(geo, "_name_index", None)
+        monkeypatch.setattr(geo, "_altname_index", None)
+        monkeypatch.setattr(geo, "_load_geonames_indexes", MagicMock(return_value=None))
+        monkeypatch.setattr(geo, "_save_geonames_indexes", MagicMock())
+        _lookup_geonames_cached.cache_clear()
+
+        try:
+            assert _lookup_geonames("springfield") == ("Springfield", "America/Chicago")
+            assert _lookup_geonames("Cap") == ("Capital City", "America/New_York")
+            fake_cache.get_cities.assert_called_once()
+        finally:
+            _lookup_geonames_cached.cache_clear()
+
+    def test_repeated_lookups_are_memoized(self) -> None:
+        """Differently-cased repeats of a name should share one cached probe."""
+        _lookup_geonames_cached.cache_clear()
+        assert _lookup_geonames("Berlin") == _lookup_geonames(" berlin ")
+        assert _lookup_geonames_cached.cache_info().hits == 1
+
+
+class TestGeonamesIndexCache:
+    """Tests for the on-disk geonames index cache."""
+
+    def test_cache_path_honours_xdg_cache_home(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Cache file should live under $XDG_CACHE_HOME/team-ops."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        path = _geonames_index_cache_path()
+        assert path.parent == tmp_path / "team-ops"
+        assert path.suffix == ".pkl"
+
+    def test_cache_path_tracks_source_file(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A changed cities file (size or mtime) gets a different cache file."""
+        cities_file = tmp_path / "data" / "cities15000.json"
+        cities_file.parent.mkdir()
+        cities_file.write_text("{}")
+        monkeypatch.setattr(geo.geonamescache, "__file__", str(tmp_path / "__init__.py"))
+        monkeypatch.setattr(geo, "_gc", MagicMock(min_city_population=15000))
+
+        before = _geonames_index_cache_path()
+        cities_file.write_text('{"1": {}}')
+        os.utime(cities_file, ns=(0, 10**18))
+
+        assert _geonames_index_cache_path() != before
+
+    def test_build_shares_timezone_strings(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Equal timezone names from different rows should be one object."""
+        zone = "Europe/"
+        cities = {
+            "1": {"name": "Moscow", "timezone": zone + "Moscow", "population": 10},
+            "2": {"name": "Kazan", "timezone": zone + "Moscow", "population": 5},
+        }
+        fake_cache = MagicMock()
+        fake_cache.get_cities.return_value = cities
+        monkeypatch.setattr(geo, "_get_geonames_cache", lambda: fake_cache)
+
+        name_index, _ = geo._build_geonames_indexes()
+        assert name_index["moscow"][1] is name_index["kazan"][1]
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Saved indexes should load back unchanged."""
+        path = tmp_path / "team-ops" / "index.pkl"
+        indexes = ({"tokyo": ("Tokyo", "Asia/Tokyo", 1)}, {"東京": ("Tokyo", "Asia/Tokyo", 1)})
+        _save_geonames_indexes(path, indexes)
+        assert _load_geonames_indexes(path) == indexes
+
+    def test_missing_or_corrupt_cache_returns_none(self, tmp_path: Path) -> None:
+        """Missing or unreadable cache files should be ignored."""
+        path = tmp_path / "index.pkl"
+        assert _load_geonames_indexes(path) is None
+        path.write_bytes(b"not a pickle")
+        assert _load_geonames_indexes(path) is None
+
+    def test_warm_cache_skips_build(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A warm cache should be used instead of rebuilding from geonames."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        indexes = ({"tokyo": ("Tokyo", "Asia/Tokyo", 1)}, {})
+        _save_geonames_indexes(_geonames_index_cache_path(), indexes)
+        monkeypatch.setattr(geo, "_name_index", None)
+        monkeypatch.setattr(geo, "_altname_index", None)
+
+        with patch("src.core.geo._build_geonames_indexes") as mock_build:
+            assert _get_geonames_indexes() == indexes
+        mock_build.assert_not_called()
+
+
+class TestFindCitiesInText:
+    """Tests for city detection in free text."""
+
+    def test_russian_case_in_sentence(self) -> None:
+        """Declined Russian city names should be detected."""
+        cities = find_cities_in_text("Переехал в Москву")
+        assert [(c.original, c.timezone) for c in cities] == [("Москву", "Europe/Moscow")]
+
+    @pytest.mark.parametrize("text", ["", "   ", "!!! ???", "→ … —"])
+    def test_text_without_words_skips_matcher_init(self, text: str) -> None:
+        """Texts with no word characters return early without building the table."""
+        with patch("src.core.geo.CityNameMatcher._ensure_initialized") as mock_init:
+            assert find_cities_in_text(text) == []
+        mock_init.assert_not_called()
+
+    def test_ascii_text_skips_declension_fallback(self) -> None:
+        """Latin-only messages never try Russian case normalization per word."""
+        with patch("src.core.geo._normalize_russian_case") as mock_normalize:
+            find_cities_in_text("standup moved, ping me when ready")
+        mock_normalize.assert_not_called()
+
+    def test_ascii_text_skips_cjk_scan(self) -> None:
+        """ASCII-only text never reaches the CJK run regex."""
+        with patch("src.core.geo._CJK_RUN_RE") as mock_re:
+            assert find_cities_in_text("lunch at noon, then back to work") == []
+        mock_re.findall.assert_not_called()
+
+    def test_cjk_run_pattern_matches_declared_ranges(self) -> None:
+        """The CJK run regex should accept exactly the code points in _CJK_RANGES."""
+        for lo, hi in geo._CJK_RANGES:
+            for code in (lo, hi):
+                assert geo._CJK_RUN_RE.fullmatch(chr(code))
+            for code in (lo - 1, hi + 1):
+                if not any(a <= code <= b for a, b in geo._CJK_RANGES):
+                    assert geo._CJK_RUN_RE.fullmatch(chr(code)) is None
+
+    def test_detected_city_is_immutable_and_slotted(self) -> None:
+        """Results are lightweight value objects without a per-instance dict."""
+        city = find_cities_in_text("Переехал в Москву")[0]
+        assert not hasattr(city, "__dict__")
+        with pytest.raises(AttributeError):
+            city.timezone = "UTC"  # type: ignore[misc]
+
+    def test_multi_word_city_keeps_original_casing(self) -> None:
+        """Multi-word matches report the phrase as written in the message."""
+        cities = find_cities_in_text("flying to NEW York tomorrow")
+        assert (cities[0].original, cities[0].timezone) == ("NEW York", "America/New_York")
+
+    def test_cjk_without_spaces(self) -> None:
+        """CJK city names should be found inside unspaced text."""
+        cities = find_cities_in_text("明天我去北京")
+        assert [(c.original, c.timezone) for c in cities] == [("北京", "Asia/Shanghai")]
+
+    def test_cjk_multiple_cities_in_order(self) -> None:
+        """Several CJK cities in one run are returned in window order."""
+        cities = find_cities_in_text("来週東京とソウルに行きます")
+        assert [c.timezone for c in cities] == ["Asia/Tokyo", "Asia/Seoul"]
+
+    def test_cjk_run_inside_latin_text(self) -> None:
+        """CJK runs embedded in Latin text are still scanned."""
+        cities = find_cities_in_text("meeting moved, see you in 東京!")
+        assert [c.timezone for c in cities] == ["Asia/Tokyo"]
+
+    def test_no_cities(self) -> None:
+        """Plain text without city names returns nothing."""
+        assert find_cities_in_text("ping me when ready") == []
+
 
 class TestGeocodeCity:
     """Tests for the main geocode_city function."""
@@ -136,6 +343,12 @@ class TestGeocodeCity:
         result = geocode_city("NotARealPlace123", use_llm=False)
         assert result is None
 
+    def test_ascii_miss_skips_russian_normalization(self) -> None:
+        """Latin-only names cannot carry Russian case endings."""
+        with patch("src.core.geo._normalize_russian_case") as mock_normalize:
+            assert geocode_city("NotARealPlace123", use_llm=False) is None
+        mock_normalize.assert_not_called()
+
 
 class TestGeocodeCityStr:
     """Tests for string result format (backwards compatibility)."""
@@ -181,3 +394,70 @@ class TestRealWorldCases:
         result = geocode_city(city, use_llm=False)
         assert result is not None, f"Failed to geocode '{city}'"
         assert result[1] == expected_tz, f"Expected {expected_tz}, got {result[1]}"
+
+
+class TestCityMatcherPrewarm:
+    """Tests for background initialization of the city matcher."""
+
+    def test_prewarm_initializes_singleton(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The prewarm thread should leave the shared matcher ready to use."""
+        monkeypatch.setattr(geo, "_matcher", None)
+        thread = geo.prewarm_city_matcher()
+        thread.join(timeout=30)
+        assert geo.get_city_matcher()._initialized
+
+    def test_concurrent_initialization_builds_once(self) -> None:
+        """Callers racing the prewarm should wait for it rather than rebuild."""
+        calls = 0
+
+        def slow_indexes() -> tuple[dict, dict]:
+            nonlocal calls
+            calls += 1
+            time.sleep(0.05)
+            return {"tokyo": ("Tokyo", "Asia/Tokyo", 10_000_000)}, {}
+
+        matcher = geo.CityNameMatcher()
+        with patch("src.core.geo._get_geonames_indexes", side_effect=slow_indexes):
+            threads = [threading.Thread(target=matcher._ensure_initialized) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert calls == 1
+        assert [c.timezone for c in matcher.find_cities("Tokyo")] == ["Asia/Tokyo"]
+
+
+class TestNormalizeWithLLM:
+    """Tests for LLM city normalization caching."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self) -> None:
+        _ask_llm_city_name.cache_clear()
+
+    def test_answers_are_memoized(self) -> None:
+        """Repeated names should reuse the first LLM answer."""
+        llm = MagicMock()
+        llm.invoke.return_value = MagicMock(content="Moscow")
+        with patch("src.core.geo._get_city_llm", return_value=llm):
+            assert _normalize_with_llm("Мск") == "Moscow"
+            assert _normalize_with_llm("Мск") == "Moscow"
+        llm.invoke.assert_called_once()
+
+    def test_unknown_answers_are_memoized(self) -> None:
+        """UNKNOWN is cached as a miss so it is not asked again."""
+        llm = MagicMock()
+        llm.invoke.return_value = MagicMock(content="UNKNOWN")
+        with patch("src.core.geo._get_city_llm", return_value=llm):
+            assert _normalize_with_llm("Нигдеград") is None
+            assert _normalize_with_llm("Нигдеград") is None
+        llm.invoke.assert_called_once()
+
+    def test_failures_are_not_cached(self) -> None:
+        """Transient LLM errors should be retried on the next call."""
+        llm = MagicMock()
+        llm.invoke.side_effect = [TimeoutError("slow"), MagicMock(content="Kazan")]
+        with patch("src.core.geo._get_city_llm", return_value=llm):
+            assert _normalize_with_llm("Казань-сити") is None
+            assert _normalize_with_llm("Казань-сити") == "Kazan"
+        assert llm.invoke.call_count == 2
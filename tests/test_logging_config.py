@@ -5,12 +5,17 @@ Tests that structlog is properly configured and logging works.
 
 from __future__ import annotations
 
+import io
+
+import orjson
+import pytest
 import structlog
 
 from src.core.logging_config import (
     bind_contextvars,
     clear_contextvars,
     configure_logging,
+    flush_logs,
     get_logger,
 )
 
@@ -30,6 +35,79 @@ class TestLoggingConfiguration:
         logger = get_logger("test")
         assert logger is not None
 
+    def test_json_output_is_one_object_per_line(
+        self, capsysbinary: pytest.CaptureFixture[bytes]
+    ) -> None:
+        """JSON mode writes orjson-rendered events as bytes."""
+        configure_logging(level="INFO", json_output=True)
+        get_logger("test").info("user_tz_saved", tz="Europe/Berlin")
+
+        flush_logs()
+        event = orjson.loads(capsysbinary.readouterr().out.splitlines()[-1])
+        assert event["event"] == "user_tz_saved"
+        assert event["tz"] == "Europe/Berlin"
+        assert event["level"] == "info"
+
+    @pytest.mark.parametrize(("level", "has_callsite"), [("INFO", False), ("DEBUG", True)])
+    def test_callsite_info_only_at_debug(
+        self, level: str, has_callsite: bool, capsysbinary: pytest.CaptureFixture[bytes]
+    ) -> None:
+        """Module/function info is added only when logging at DEBUG."""
+        configure_logging(level=level, json_output=True)
+        get_logger("test").info("callsite_check")
+
+        flush_logs()
+        event = orjson.loads(capsysbinary.readouterr().out.splitlines()[-1])
+        assert ("func_name" in event) is has_callsite
+        assert ("module" in event) is has_callsite
+
+    def test_cached_logger_keeps_writing_after_reconfigure(
+        self, capsysbinary: pytest.CaptureFixture[bytes]
+    ) -> None:
+        """Loggers cached before a reconfigure still reach stdout afterwards."""
+        configure_logging(level="INFO", json_output=True)
+        logger = get_logger("test")
+        logger.info("first")
+
+        configure_logging(level="INFO", json_output=True)
+        logger.info("second")
+
+        flush_logs()
+        events = [
+            orjson.loads(line)["event"] for line in capsysbinary.readouterr().out.splitlines()
+        ]
+        assert events[-2:] == ["first", "second"]
+
+    def test_writer_survives_closed_stream(self) -> None:
+        """A closed stdout drops lines instead of killing the writer or hanging flush."""
+        from src.core.logging_config import _BackgroundWriter
+
+        stream = io.BytesIO()
+        writer = _BackgroundWriter(stream)
+        stream.close()
+
+        writer.put(b'{"event": "lost"}')
+        writer.flush(timeout=1.0)
+        writer.put(b'{"event": "lost again"}')
+        writer.close(timeout=1.0)
+
+        assert not writer._thread.is_alive()
+
+    @pytest.mark.parametrize("context_vars", [True, False])
+    def test_context_vars_can_be_disabled(
+        self, context_vars: bool, capsysbinary: pytest.CaptureFixture[bytes]
+    ) -> None:
+        """Bound context is merged only when context_vars is enabled."""
+        configure_logging(level="INFO", json_output=True, context_vars=context_vars)
+        clear_contextvars()
+        bind_contextvars(request_id="abc123")
+        get_logger("test").info("context_check")
+        clear_contextvars()
+
+        flush_logs()
+        event = orjson.loads(capsysbinary.readouterr().out.splitlines()[-1])
+        assert ("request_id" in event) is context_vars
+
     def test_get_logger_returns_bound_logger(self) -> None:
         """get_logger should return a structlog logger."""
         configure_logging(level="DEBUG", json_output=False)
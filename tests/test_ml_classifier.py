@@ -7,6 +7,7 @@ Contract: contains_time_ml(text, use_llm_fallback=False) → bool
 from __future__ import annotations
 
 import csv
+import threading
 from pathlib import Path
 
 import pytest
@@ -38,6 +39,24 @@ def test_classifier_predict_proba_returns_float() -> None:
     assert 0.0 <= proba <= 1.0
 
 
+@pytest.mark.parametrize(
+    "text",
+    ["Let's meet at 3pm", "Встреча в 14:30", "I have 3 cats", "a", "", "  Um  14 Uhr  "],
+)
+def test_fast_path_matches_sklearn(text: str) -> None:
+    """Precomputed n-gram weights give the same answers as the sklearn pipeline."""
+    classifier = get_classifier()
+    assert classifier.vectorizer is not None
+    assert classifier.model is not None
+
+    X = classifier.vectorizer.transform([text])
+
+    assert classifier.predict_proba(text) == pytest.approx(
+        float(classifier.model.predict_proba(X)[0][1]), abs=1e-12
+    )
+    assert classifier.predict(text) == bool(classifier.model.predict(X)[0] == 1)
+
+
 # ============================================================================
 # Behavior Tests - Positive Cases (should detect time)
 # ============================================================================
@@ -234,3 +253,54 @@ def test_unicode_text() -> None:
     text = "Встреча в 14:00 🕐"
     result = contains_time_ml(text, use_llm_fallback=False)
     assert isinstance(result, bool)
+
+
+# ============================================================================
+# Startup Prewarm
+# ============================================================================
+
+
+def test_prewarm_loads_classifier_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The prewarm thread and racing callers should share a single load."""
+    from src.core import time_classifier
+
+    loads = 0
+    original_load = time_classifier.TimeClassifier.load
+
+    def counting_load(self: time_classifier.TimeClassifier, path: Path | None = None) -> None:
+        nonlocal loads
+        loads += 1
+        original_load(self, path)
+
+    monkeypatch.setattr(time_classifier, "_classifier", None)
+    monkeypatch.setattr(time_classifier.TimeClassifier, "load", counting_load)
+
+    thread = time_classifier.prewarm_classifier()
+    classifier = time_classifier.get_classifier()
+    thread.join(timeout=30)
+
+    assert classifier is time_classifier.get_classifier()
+    assert classifier.is_trained
+    assert loads == 1
+
+
+async def test_async_cold_load_runs_off_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A cold load from async code happens in a worker thread, not on the loop."""
+    from src.core import time_classifier
+
+    load_threads: list[int] = []
+    original_load = time_classifier.TimeClassifier.load
+
+    def recording_load(self: time_classifier.TimeClassifier, path: Path | None = None) -> None:
+        load_threads.append(threading.get_ident())
+        original_load(self, path)
+
+    monkeypatch.setattr(time_classifier, "_classifier", None)
+    monkeypatch.setattr(time_classifier.TimeClassifier, "load", recording_load)
+
+    classifier = await time_classifier.get_classifier_async()
+
+    assert classifier.is_trained
+    assert load_threads
+    assert threading.get_ident() not in load_threads
+    assert await time_classifier.get_classifier_async() is classifier
@@ -2,22 +2,35 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
+from jinja2 import FileSystemLoader, Template
 
 from src.core.prompts import (
-    _template_cache,
+    _env,
+    _render_agent_prompt,
+    _render_ui_message,
+    _static_prompt_cache,
     get_agent_system_prompt,
     get_ui_message,
     load_prompt,
 )
 
 
+def _clear_templates() -> None:
+    """Drop compiled templates so the next load reads from disk."""
+    assert _env.cache is not None
+    _env.cache.clear()
+
+
 class TestLoadPrompt:
     """Tests for load_prompt function."""
 
     def setup_method(self) -> None:
         """Clear template cache before each test."""
-        _template_cache.clear()
+        _clear_templates()
+        _static_prompt_cache.clear()
 
     def test_load_existing_prompt(self) -> None:
         """Should load an existing prompt file."""
@@ -35,11 +48,12 @@ class TestLoadPrompt:
 
     def test_load_prompt_caches_template(self) -> None:
         """Should cache template after first load."""
-        assert "ui/onboarding" not in _template_cache
+        load_prompt("ui/saved", tz_iana="Europe/Moscow")
 
-        load_prompt("ui/onboarding")
+        with patch.object(FileSystemLoader, "get_source", side_effect=AssertionError("reloaded")):
+            result = load_prompt("ui/saved", tz_iana="Asia/Tokyo")
 
-        assert "ui/onboarding" in _template_cache
+        assert "Asia/Tokyo" in result
 
     def test_load_prompt_uses_cache(self) -> None:
         """Should use cached template on subsequent calls."""
@@ -49,7 +63,15 @@ class TestLoadPrompt:
         result2 = load_prompt("ui/onboarding")
 
         assert result1 == result2
-        assert "ui/onboarding" in _template_cache
+
+    def test_static_prompt_is_rendered_once(self) -> None:
+        """Prompts loaded without variables reuse their first rendering."""
+        first = load_prompt("ui/onboarding")
+
+        with patch.object(Template, "render", side_effect=AssertionError("re-rendered")):
+            second = load_prompt("ui/onboarding")
+
+        assert second is first
 
     def test_load_prompt_strips_whitespace(self) -> None:
         """Should strip leading/trailing whitespace."""
@@ -70,13 +92,49 @@ class TestLoadPrompt:
         assert isinstance(result, str)
         assert len(result) > 0
 
+    @pytest.mark.parametrize(
+        ("name", "variables"),
+        [
+            ("trigger_detect", {}),
+            ("parse_time", {"current_datetime": "2026-01-01T10:00", "timezone_hints": "none"}),
+            (
+                "timezone_resolve",
+                {
+                    "recent_messages": "",
+                    "detected_times": "",
+                    "user_tz": "UTC",
+                    "chat_tzs": "",
+                },
+            ),
+        ],
+    )
+    def test_llm_prompts_put_variables_last(self, name: str, variables: dict[str, str]) -> None:
+        """LLM prompts keep the static instructions as a shared prefix."""
+        first = load_prompt(name, message="Call at 5", **variables)
+        second = load_prompt(name, message="Встреча в 7", **variables)
+
+        prefix_len = len(first) - len(first.split("Call at 5", 1)[1]) - len("Call at 5")
+        assert prefix_len > len(first) // 2
+        assert second.startswith(first[:prefix_len])
+
 
 class TestGetAgentSystemPrompt:
     """Tests for get_agent_system_prompt function."""
 
     def setup_method(self) -> None:
-        """Clear template cache before each test."""
-        _template_cache.clear()
+        """Clear template and rendered prompt caches before each test."""
+        _clear_templates()
+        _render_agent_prompt.cache_clear()
+
+    def test_prompt_is_rendered_once_per_timezone(self) -> None:
+        """Repeated agent turns in the same timezone reuse the rendered prompt."""
+        first = get_agent_system_prompt("Europe/Prague")
+
+        with patch.object(Template, "render", side_effect=AssertionError("re-rendered")):
+            second = get_agent_system_prompt("Europe/Prague")
+
+        assert second is first
+        assert get_agent_system_prompt("Asia/Tokyo") != first
 
     def test_without_current_tz(self) -> None:
         """Should return prompt without dynamic CONTEXT section."""
@@ -105,8 +163,35 @@ class TestGetUiMessage:
     """Tests for get_ui_message function."""
 
     def setup_method(self) -> None:
-        """Clear template cache before each test."""
-        _template_cache.clear()
+        """Clear template and rendered message caches before each test."""
+        _clear_templates()
+        _render_ui_message.cache_clear()
+
+    def test_rendered_message_is_reused(self) -> None:
+        """Repeated UI messages with the same variables render once."""
+        first = get_ui_message("saved", tz_iana="Asia/Tokyo")
+
+        with patch.object(Template, "render", side_effect=AssertionError("re-rendered")):
+            second = get_ui_message("saved", tz_iana="Asia/Tokyo")
+
+        assert second is first
+        assert "Asia/Tokyo" in first
+
+    def test_message_with_user_text_is_not_cached(self) -> None:
+        """Messages echoing raw user input bypass the render cache."""
+        get_ui_message("city_not_found", city_name="somewhere over the rainbow")
+
+        assert _render_ui_message.cache_info().currsize == 0
+
+    def test_ui_messages_do_not_evict_agent_prompts(self) -> None:
+        """UI renders and agent system prompts are cached separately."""
+        _render_agent_prompt.cache_clear()
+        prompt = get_agent_system_prompt("Europe/Prague")
+
+        get_ui_message("saved", tz_iana="Asia/Tokyo")
+
+        assert _render_agent_prompt.cache_info().currsize == 1
+        assert get_agent_system_prompt("Europe/Prague") is prompt
 
     def test_onboarding_message(self) -> None:
         """Should load onboarding message."""
@@ -127,6 +127,25 @@ class TestStateManagerProtocol:
         # value is IANA timezone string or None
         assert result.value is None or isinstance(result.value, str)
 
+    async def test_timezone_state_manager_maps_source_strings(self) -> None:
+        """update_state() maps known sources and falls back to DEFAULT."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from src.core.models import Platform, TimezoneSource
+        from src.core.state.timezone import TimezoneStateManager
+
+        storage = MagicMock()
+        storage.upsert_user_tz_state = AsyncMock()
+        manager = TimezoneStateManager(storage)
+
+        for source, expected in [
+            ("web_verified", TimezoneSource.WEB_VERIFIED),
+            ("bogus", TimezoneSource.DEFAULT),
+        ]:
+            await manager.update_state(Platform.TELEGRAM, "user_1", "Asia/Tokyo", source, 1.0)
+            state = storage.upsert_user_tz_state.call_args.args[0]
+            assert state.source is expected
+
 
 # ============================================================================
 # ActionHandler Protocol Tests
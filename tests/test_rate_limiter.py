@@ -81,6 +81,19 @@ class TestRateLimiter:
         retry_after = limiter.get_retry_after("user1")
         assert 8 <= retry_after <= 10  # Should be close to window_seconds
 
+    def test_sliding_window_drops_only_expired_requests(self) -> None:
+        """Only requests older than the window free up capacity."""
+        config = RateLimitConfig(requests=2, window_seconds=10)
+        limiter = RateLimiter(config)
+
+        with patch("src.core.rate_limiter.time") as mock_time:
+            for now, allowed in ((0.0, True), (5.0, True), (6.0, False), (10.5, True)):
+                mock_time.return_value = now
+                assert limiter.is_allowed("user1") is allowed
+            mock_time.return_value = 11.0
+            assert limiter.get_retry_after("user1") == 4
+            assert list(limiter._requests["user1"]) == [5.0, 10.5]
+
     def test_reset_clears_limit_for_key(self) -> None:
         """reset should clear rate limit for a specific key."""
         config = RateLimitConfig(requests=2, window_seconds=60)
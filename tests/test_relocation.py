@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 
 from src.core.models import NormalizedEvent, Platform
-from src.core.triggers.relocation import RelocationDetector
+from src.core.triggers.relocation import PATTERN_KEYWORDS, RELOCATION_PATTERNS, RelocationDetector
+
+if TYPE_CHECKING:
+    import re
 
 
 class TestRelocationDetector:
@@ -218,3 +223,26 @@ class TestRelocationTriggerData:
         triggers = await detector.detect(event)
         assert "pattern" in triggers[0].data
         assert triggers[0].data["pattern"] == "moved_to"
+
+
+class TestPatternKeywords:
+    """Tests for the keyword pre-check in front of the relocation regexes."""
+
+    @pytest.mark.parametrize(("pattern", "name"), RELOCATION_PATTERNS)
+    def test_every_pattern_has_a_literal_keyword(self, pattern: re.Pattern[str], name: str) -> None:
+        """Each pattern's keyword is a literal part of it, so the pre-check never hides a match."""
+        keyword = PATTERN_KEYWORDS[name]
+        assert keyword == keyword.lower()
+        assert keyword in pattern.pattern
+
+    async def test_uppercase_message_still_matches(self) -> None:
+        """The keyword check is case-insensitive like the regexes."""
+        event = NormalizedEvent(
+            platform=Platform.TELEGRAM,
+            event_id="test_event",
+            chat_id="test_chat",
+            user_id="test_user",
+            text="ПЕРЕЕХАЛ В МОСКВУ",
+        )
+        triggers = await RelocationDetector().detect(event)
+        assert triggers[0].data["pattern"] == "relocated_ru"
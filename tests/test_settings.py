@@ -47,6 +47,24 @@ class TestConfiguration:
         # Other defaults should still apply
         assert config.database.name == "team_ops"
 
+    def test_team_city_by_name_index(self) -> None:
+        """Team cities are indexed once by lowercased name; first duplicate wins."""
+        config = Configuration.model_validate(
+            {
+                "timezone": {
+                    "team_cities": [
+                        {"name": "London", "tz": "Europe/London"},
+                        {"name": "LONDON", "tz": "America/Toronto"},
+                    ]
+                }
+            }
+        )
+        index = config.timezone.team_city_by_name
+
+        assert list(index) == ["london"]
+        assert index["london"].tz == "Europe/London"
+        assert config.timezone.team_city_by_name is index
+
 
 class TestSettings:
     """Tests for Settings class."""
@@ -211,6 +211,27 @@ def test_city_hint_pattern_matches(text: str) -> None:
     assert match is not None, f"City hint should match: {text}"
 
 
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("3pm London time", "Europe/London"),
+        ("14:00 New York", "America/New_York"),
+        ("14:00 new  york", None),
+        ("10am PST in Tokyo", "America/Los_Angeles"),
+        ("в 15 мск", "Europe/Moscow"),
+        ("3pm in Lahore", None),
+        ("3pm CST_ASIA", "Asia/Shanghai"),
+    ],
+)
+def test_nearest_tz_hint_agrees_with_hint_patterns(text: str, expected: str | None) -> None:
+    """The word-lookup scan finds the same hints as the tz/city alternations."""
+    from src.core.time_parse import _find_nearest_tz_hint
+
+    assert _find_nearest_tz_hint(text, 0, max_distance=len(text)) == expected
+    regex_hit = PATTERNS["tz_hint"].search(text) or PATTERNS["city_hint"].search(text.lower())
+    assert (regex_hit is not None) == (expected is not None)
+
+
 # ============================================================================
 # parse_times() Function Tests
 # ============================================================================
@@ -38,7 +38,7 @@ def _mock_llm_settings(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
     Creates mock settings with real Configuration (defaults) but overridden LLM config.
     """
     from src import settings
-    from src.core.llm_fallback import get_circuit_breaker
+    from src.core.llm_fallback import clear_llm_caches, get_circuit_breaker
     from src.settings import CircuitBreakerConfig, Configuration, LLMConfig
 
     original = getattr(settings, "_settings", None)
@@ -61,6 +61,7 @@ def _mock_llm_settings(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
         config = real_config
 
     monkeypatch.setattr(settings, "_settings", MockSettings())
+    clear_llm_caches()
 
     # Reset circuit breaker to clean state
     try: